@@ -7,25 +7,150 @@ Syncropel's API server adheres to the standard ASGI (Asynchronous Server
 Gateway Interface) specification. Any class that follows the ASGI
 middleware pattern can be registered as a `syncropel.api.middleware`
 plugin.
+
+Middleware must be written as pure ASGI. Wrappers in the style of Starlette's
+`BaseHTTPMiddleware` buffer and re-dispatch every request through an extra task
+and are rejected at registration (see `check_middleware`). The server itself is
+expected to run on uvloop with the httptools parser; middleware should not add
+per-request overhead on top of that floor.
 """
 
-from typing import Protocol, Callable, Awaitable
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypedDict,
+    runtime_checkable,
+)
+
+
+# These are the standard type hints for an ASGI application. Only the keys this
+# SDK and its middleware commonly read are declared; servers may add others.
+class Scope(TypedDict, total=False):
+    type: str
+    asgi: Dict[str, str]
+    http_version: str
+    method: str
+    scheme: str
+    path: str
+    raw_path: bytes
+    query_string: bytes
+    root_path: str
+    headers: Iterable[Tuple[bytes, bytes]]
+    client: Optional[Tuple[str, int]]
+    server: Optional[Tuple[str, Optional[int]]]
+    state: Dict[str, Any]
+
 
-# These are the standard type hints for an ASGI application
-Scope = dict
-Receive = Callable[[], Awaitable[dict]]
-Send = Callable[[dict], Awaitable[None]]
+class Message(TypedDict, total=False):
+    type: str
+    status: int
+    headers: Iterable[Tuple[bytes, bytes]]
+    body: bytes
+    more_body: bool
+
+
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
 ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
 
 
+@runtime_checkable
 class BaseApiMiddleware(Protocol):
     """
     A structural type hint (Protocol) for an ASGI middleware class.
 
     A valid middleware must have an `__init__` that accepts the next app in
     the chain and an `async __call__` method with the standard ASGI signature.
+
+    Every message a middleware passes to `send` costs an `await` in each layer
+    of the stack, so implementations should stay on the low-overhead path:
+
+    - Wrap `send` only when the middleware actually needs to inspect or change
+      outgoing messages; otherwise pass it through to `self.app` untouched.
+    - When the middleware produces a response whose body is fully materialized,
+      send exactly two messages (`http.response.start` and one
+      `http.response.body` without `more_body`), e.g. via `send_all`, rather
+      than many small `more_body=True` chunks.
+
+    Performance contract:
+
+    - Call `await self.app(scope, receive, send)` exactly once per request.
+    - Do not read or buffer the request body unless the middleware declares
+      `buffers_request_body = True`. Pass `receive` through untouched otherwise.
+    - Do not subclass `BaseHTTPMiddleware` or similar request/response wrappers.
+
+    `PassthroughASGIMiddleware` is a reference implementation of this pattern.
     """
 
     def __init__(self, app: ASGIApp): ...
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None: ...
+
+
+class PassthroughASGIMiddleware:
+    """
+    A reference middleware showing the low-overhead pattern: it forwards
+    `receive` untouched, wraps `send` only to observe the response start, and
+    calls the next app exactly once. Subclasses override `on_response_start`.
+    """
+
+    buffers_request_body = False
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self.on_response_start(scope, message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def on_response_start(self, scope: Scope, message: Message) -> None:
+        """Called once per HTTP response, before its start message is sent."""
+        pass
+
+
+def check_middleware(middleware_cls: Type[Any]) -> None:
+    """
+    Validates a middleware class at plugin registration.
+
+    Raises:
+        TypeError: If the class does not follow the ASGI middleware contract or
+            is built on a `BaseHTTPMiddleware`-style wrapper.
+    """
+    if any(base.__name__ == "BaseHTTPMiddleware" for base in middleware_cls.__mro__):
+        raise TypeError(
+            f"Middleware '{middleware_cls.__name__}' subclasses BaseHTTPMiddleware; "
+            "API middleware must be implemented as pure ASGI."
+        )
+    if not any("__call__" in vars(base) for base in middleware_cls.__mro__[:-1]):
+        raise TypeError(
+            f"Middleware '{middleware_cls.__name__}' does not define an ASGI __call__."
+        )
+
+
+async def send_all(send: Send, events: List[Message]) -> None:
+    """
+    Sends a pre-built sequence of ASGI messages in order.
+
+    Intended for complete responses, e.g.
+    `[{"type": "http.response.start", ...}, {"type": "http.response.body", "body": b"..."}]`,
+    so that middleware can build the whole response up front and hand it over in
+    one call instead of interleaving its own logic between sends.
+    """
+    for event in events:
+        await send(event)
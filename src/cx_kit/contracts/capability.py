@@ -6,10 +6,23 @@ Syncropel ecosystem. Every strategy, session manager, or remote executor
 plugin must implement one of these base classes.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, ClassVar, Dict, List, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    runtime_checkable,
+)
 from contextlib import asynccontextmanager
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 if TYPE_CHECKING:
     from ..schemas.context import RunContext
@@ -19,6 +32,24 @@ if TYPE_CHECKING:
     from ..schemas.jobs import JobPayload, JobHandle, JobStatus
 
 
+def _cache_functions(
+    get_functions: Callable[[Any], Sequence["FunctionSignature"]],
+) -> Callable[[Any], Tuple["FunctionSignature", ...]]:
+    """Wraps a `get_functions` implementation so it runs once per class."""
+
+    @functools.wraps(get_functions)
+    def cached_get_functions(self) -> Tuple["FunctionSignature", ...]:
+        cls = type(self)
+        functions = cls.__dict__.get("_function_cache")
+        if functions is None:
+            functions = tuple(get_functions(self))
+            if cls.cache_functions:
+                cls._function_cache = functions
+        return functions
+
+    return cached_get_functions
+
+
 class BaseCapability(ABC):
     """
     The unified, abstract contract for ANY pluggable capability in the Syncropel ecosystem.
@@ -30,6 +61,26 @@ class BaseCapability(ABC):
 
     capability_id: ClassVar[str]
 
+    # Capabilities whose functions never depend on instance state (config,
+    # injected services) may set `cache_functions = True`: `get_functions()` is
+    # then computed on first call and shared by every instance of the class.
+    cache_functions: ClassVar[bool] = False
+    _function_cache: ClassVar[Optional[Tuple["FunctionSignature", ...]]] = None
+    # One compiled parameter validator per function name, built on first use and
+    # kept on the class if `cache_functions` is set, otherwise on the instance.
+    _parameter_adapters: ClassVar[Optional[Dict[str, TypeAdapter]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._function_cache = None
+        get_functions = cls.__dict__.get("get_functions")
+        if (
+            cls.cache_functions
+            and get_functions is not None
+            and not getattr(get_functions, "__isabstractmethod__", False)
+        ):
+            cls.get_functions = _cache_functions(get_functions)
+
     def __init__(self, services: Dict[str, Any]):
         """
         The constructor for dependency injection. The orchestrator will pass a
@@ -38,12 +89,63 @@ class BaseCapability(ABC):
         pass
 
     @abstractmethod
-    def get_functions(self) -> List["FunctionSignature"]:
+    def get_functions(self) -> Sequence["FunctionSignature"]:
         """
         Advertises the functions this capability provides to the system.
+
+        If `cache_functions` is set, the result is computed once per class and
+        returned as an immutable tuple on every subsequent call.
         """
         raise NotImplementedError
 
+    @classmethod
+    def class_functions(cls) -> Tuple["FunctionSignature", ...]:
+        """
+        Returns the functions cached for the class, so discovery can list a
+        capability's tools again without another instance.
+
+        Only classes with `cache_functions = True` have such a cache, and it is
+        filled by the first `get_functions()` call on an instance.
+
+        Raises:
+            LookupError: If the class has no cached functions.
+        """
+        functions = cls.__dict__.get("_function_cache")
+        if functions is None:
+            raise LookupError(
+                f"Capability '{cls.__name__}' has no cached functions; "
+                "call get_functions() on an instance."
+            )
+        return functions
+
+    def parameter_adapter(self, function_name: str) -> TypeAdapter:
+        """
+        Returns the `TypeAdapter` for a function's `input_schema`.
+
+        Dispatchers that receive raw parameters from the wire should call
+        `adapter.validate_python(raw)` (or `validate_json`) instead of
+        `Model(**raw)`. The adapters for all of the capability's functions are
+        built together from `get_functions()` the first time any is requested.
+
+        Raises:
+            NameError: If the capability has no function with this name.
+        """
+        owner = type(self) if self.cache_functions else self
+        adapters = vars(owner).get("_parameter_adapters")
+        if adapters is None:
+            adapters = {
+                signature.name: TypeAdapter(signature.input_schema)
+                for signature in self.get_functions()
+            }
+            setattr(owner, "_parameter_adapters", adapters)
+        try:
+            return adapters[function_name]
+        except KeyError:
+            raise NameError(
+                f"Capability '{type(self).__name__}' has no function named "
+                f"'{function_name}'."
+            ) from None
+
     @abstractmethod
     async def execute_function(
         self, function_name: str, context: "RunContext", parameters: BaseModel
@@ -108,3 +210,25 @@ class BaseRemoteExecutorCapability(BaseCapability):
     async def terminate(self, job_handle: "JobHandle") -> None:
         """Terminates or cancels a running remote job."""
         raise NotImplementedError
+
+
+@runtime_checkable
+class CapabilityProtocol(Protocol):
+    """
+    The structural equivalent of `BaseCapability`.
+
+    Plugin loaders should accept any class satisfying this protocol rather than
+    requiring `issubclass(cls, BaseCapability)`. Plugins may then skip the ABC
+    (and its abstract-method check on every instantiation) and use `__slots__`.
+    `isinstance` only checks that the members exist, not their signatures.
+    """
+
+    capability_id: ClassVar[str]
+
+    def get_functions(self) -> Sequence["FunctionSignature"]: ...
+
+    async def execute_function(
+        self, function_name: str, context: "RunContext", parameters: BaseModel
+    ) -> "StepResult": ...
+
+    async def shutdown(self): ...
@@ -9,7 +9,7 @@ This inheritance acts as a marker that allows the central ConfigManager
 to discover these schemas via the 'syncropel.configs' entry point.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BaseConfig(BaseModel):
@@ -38,4 +38,7 @@ class BaseConfig(BaseModel):
         ```
     """
 
-    pass
+    # Inherited by every plugin's config schema. Hosts discover many of these via
+    # entry points but only validate the sections a user actually configures, so
+    # each core schema is built on first use rather than at import.
+    model_config = ConfigDict(defer_build=True)
@@ -5,7 +5,7 @@ Defines the abstract contract for all pluggable discovery providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import Any, AsyncIterator, List
 from ..schemas.discovery import CapabilityDefinition
 
 
@@ -23,3 +23,21 @@ class BaseDiscoveryProvider(ABC):
     async def discover(self, source: Any) -> List[CapabilityDefinition]:
         """Parse the source and return a list of standardized capability definitions."""
         raise NotImplementedError
+
+    async def discover_iter(self, source: Any) -> AsyncIterator[CapabilityDefinition]:
+        """
+        Yields capability definitions one at a time as they are parsed.
+
+        Registries should prefer this over `discover`, so that registering
+        definition #1 overlaps with reading and parsing the rest:
+
+            async for definition in provider.discover_iter(source):
+                await registry.add(definition)
+
+        The default implementation just yields the result of `discover`.
+        Providers that read from slow sources (URLs, large multi-document files)
+        should override it to yield each entry as soon as it is complete, e.g.
+        from a streaming HTTP response.
+        """
+        for definition in await self.discover(source):
+            yield definition
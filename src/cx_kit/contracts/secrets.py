@@ -11,7 +11,7 @@ variables, or dedicated secret managers (e.g., Vault).
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict, Type, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, Protocol, Type, TYPE_CHECKING, runtime_checkable
 
 if TYPE_CHECKING:
     from .config import BaseConfig
@@ -60,3 +60,19 @@ class BaseSecretProvider(ABC):
             Exception: For any other provider-specific errors.
         """
         raise NotImplementedError
+
+
+@runtime_checkable
+class SecretProviderProtocol(Protocol):
+    """
+    The structural equivalent of `BaseSecretProvider`.
+
+    Providers may satisfy this protocol without inheriting from the ABC (for
+    example to use `__slots__`), and loaders can check for it with
+    `isinstance`, which only checks that the members exist.
+    """
+
+    provider_key: ClassVar[str]
+    ConfigModel: ClassVar[Type["BaseConfig"]]
+
+    async def get_secrets(self, path: str) -> Dict[str, Any]: ...
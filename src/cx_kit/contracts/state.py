@@ -12,10 +12,11 @@ or a file-based system.
 """
 
 from abc import ABC, abstractmethod
-from typing import ClassVar, Type, TYPE_CHECKING
+from typing import ClassVar, Dict, Protocol, Type, TYPE_CHECKING, runtime_checkable
+
+from .config import BaseConfig
 
 if TYPE_CHECKING:
-    from .config import BaseConfig
     from ..schemas.context import RunContext
     from ..schemas.results import StepResult
 
@@ -56,6 +57,11 @@ class BaseStateProvider(ABC):
         """
         Retrieves a `RunContext` by its unique `run_id`.
 
+        Backends that serialize the context should rebuild it with
+        `RunContext.model_construct` (re-attaching the injected services): the
+        stored data was validated when it was created and must not pay for a
+        second validation pass on every read.
+
         Args:
             run_id: The ID of the run to retrieve.
 
@@ -80,8 +86,14 @@ class BaseStateProvider(ABC):
     @abstractmethod
     async def add_step_result(self, run_id: str, step_id: str, result: "StepResult"):
         """
-        Atomically appends or updates a single step's result within a stored
-        `RunContext`. This can be more efficient than a full save.
+        Atomically appends or updates a single step's result for a stored run.
+
+        Implementations MUST write only this step's entry using a backend-native
+        partial operation, never by loading and re-saving the whole run. For
+        example, Redis `HSET run:<id>:steps <step_id> <json>`, a Postgres
+        `UPDATE ... SET steps = jsonb_set(...)`, or appending a line to a
+        `steps.ndjson` file. Rewriting the full state on every step makes a
+        workflow's persistence cost quadratic in its number of steps.
 
         Args:
             run_id: The ID of the run to update.
@@ -90,6 +102,22 @@ class BaseStateProvider(ABC):
         """
         raise NotImplementedError
 
+    async def get_step_results(self, run_id: str) -> Dict[str, "StepResult"]:
+        """
+        Returns the step results recorded with `add_step_result`, keyed by step ID.
+
+        Not abstract, so providers written before it was added still load; they
+        raise `NotImplementedError` here until they implement it.
+
+        Raises:
+            KeyError: If no context for the given run_id is found.
+            NotImplementedError: If the provider cannot read back step results.
+        """
+        raise NotImplementedError(
+            f"State provider '{type(self).__name__}' does not implement "
+            "get_step_results()."
+        )
+
     @abstractmethod
     async def delete(self, run_id: str):
         """
@@ -100,3 +128,70 @@ class BaseStateProvider(ABC):
             run_id: The ID of the run to delete.
         """
         raise NotImplementedError
+
+
+class InMemoryStateProvider(BaseStateProvider):
+    """
+    The reference `BaseStateProvider`, keeping every run in process memory.
+
+    Contexts are stored as the objects themselves, so reads need no
+    deserialization, and step results live in a per-run dictionary that
+    `add_step_result` updates in place.
+    """
+
+    provider_key: ClassVar[str] = "system:memory"
+    ConfigModel: ClassVar[Type[BaseConfig]] = BaseConfig
+
+    def __init__(self, config: BaseConfig):
+        super().__init__(config)
+        self._contexts: Dict[str, "RunContext"] = {}
+        self._step_results: Dict[str, Dict[str, "StepResult"]] = {}
+
+    async def create(self, initial_context: "RunContext") -> str:
+        run_id = initial_context.run_id
+        self._contexts[run_id] = initial_context
+        self._step_results[run_id] = {}
+        return run_id
+
+    async def get(self, run_id: str) -> "RunContext":
+        return self._contexts[run_id]
+
+    async def save(self, context: "RunContext"):
+        self._contexts[context.run_id] = context
+        self._step_results.setdefault(context.run_id, {})
+
+    async def add_step_result(self, run_id: str, step_id: str, result: "StepResult"):
+        self._step_results[run_id][step_id] = result
+
+    async def get_step_results(self, run_id: str) -> Dict[str, "StepResult"]:
+        return self._step_results[run_id]
+
+    async def delete(self, run_id: str):
+        self._contexts.pop(run_id, None)
+        self._step_results.pop(run_id, None)
+
+
+@runtime_checkable
+class StateProviderProtocol(Protocol):
+    """
+    The structural equivalent of `BaseStateProvider`.
+
+    Providers may satisfy this protocol without inheriting from the ABC, and
+    loaders can check for it with `isinstance`, which only checks that the
+    members exist.
+    """
+
+    provider_key: ClassVar[str]
+    ConfigModel: ClassVar[Type[BaseConfig]]
+
+    async def create(self, initial_context: "RunContext") -> str: ...
+
+    async def get(self, run_id: str) -> "RunContext": ...
+
+    async def save(self, context: "RunContext"): ...
+
+    async def add_step_result(
+        self, run_id: str, step_id: str, result: "StepResult"
+    ): ...
+
+    async def delete(self, run_id: str): ...
@@ -5,8 +5,9 @@ Defines the contracts for the Interception & Extension Protocol (IEP).
 """
 
 from __future__ import annotations
+import functools
 from abc import ABC, abstractmethod
-from typing import Awaitable, Callable, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Iterable, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..schemas.context import RunContext
@@ -19,10 +20,35 @@ class BaseBlockInterceptor(ABC):
     The contract for a plugin that intercepts a SINGLE code block's execution.
     This is the primary extension point for cross-cutting concerns like caching
     and logging in the native CXQL runtime.
+
+    Implement `intercept` to wrap the execution, or only `sync_intercept` for
+    hooks that just observe it (logging, auditing). The latter run inline, with
+    no coroutine of their own. A class implementing neither cannot be
+    instantiated.
     """
 
+    # Interceptors run in ascending priority order: lower values are outermost.
     priority: int = 100
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Observe-only interceptors get an `intercept` that calls their hook and
+        # continues down the chain. Otherwise `intercept` stays abstract.
+        if (
+            getattr(cls.intercept, "__isabstractmethod__", False)
+            and cls.sync_intercept is not BaseBlockInterceptor.sync_intercept
+        ):
+            cls.intercept = _observe_and_continue
+
+    def sync_intercept(self, context: "RunContext", block: "CodeBlock") -> None:
+        """
+        Observes a code block execution before it runs, synchronously.
+
+        Used instead of `intercept` when the interceptor does not implement it.
+        It cannot alter or short-circuit the execution.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def intercept(
         self,
@@ -44,3 +70,75 @@ class BaseBlockInterceptor(ABC):
             A BlockResult object, either from a cache or from the next_handler.
         """
         raise NotImplementedError
+
+
+async def _observe_and_continue(
+    self: BaseBlockInterceptor,
+    context: "RunContext",
+    block: "CodeBlock",
+    next_handler: Callable[[RunContext], Awaitable["BlockResult"]],
+) -> "BlockResult":
+    """The `intercept` of interceptors that only implement `sync_intercept`."""
+    self.sync_intercept(context, block)
+    return await next_handler(context)
+
+
+async def _observe(
+    observers: Tuple[Callable[["RunContext", "CodeBlock"], None], ...],
+    context: "RunContext",
+    block: "CodeBlock",
+    next_handler: Callable[[RunContext], Awaitable["BlockResult"]],
+) -> "BlockResult":
+    """A single chain link for a run of consecutive observe-only interceptors."""
+    for observe in observers:
+        observe(context, block)
+    return await next_handler(context)
+
+
+BlockHandler = Callable[["RunContext", "CodeBlock"], Awaitable["BlockResult"]]
+
+
+def compose_block_interceptors(
+    interceptors: Iterable[BaseBlockInterceptor], handler: BlockHandler
+) -> BlockHandler:
+    """
+    Folds a set of interceptors and the final block handler into a single
+    callable, once, at registration time.
+
+    Interceptors are sorted by `priority` here rather than on every block.
+    Observe-only interceptors (those implementing just `sync_intercept`) still
+    run at their priority position, so an inner observer is skipped when an
+    outer interceptor short-circuits (e.g. on a cache hit). Consecutive
+    observers share one chain link that calls them in a plain loop, and those
+    ahead of every wrapping interceptor are called before the chain is entered.
+    The `next_handler` links are `functools.partial` objects instead of Python
+    closures.
+    """
+    ordered = sorted(interceptors, key=lambda interceptor: interceptor.priority)
+    # Outermost first: an `intercept` method, or a list of consecutive hooks.
+    stages: List[Any] = []
+    for interceptor in ordered:
+        if type(interceptor).intercept is _observe_and_continue:
+            if stages and type(stages[-1]) is list:
+                stages[-1].append(interceptor.sync_intercept)
+            else:
+                stages.append([interceptor.sync_intercept])
+        else:
+            stages.append(interceptor.intercept)
+    leading = tuple(stages.pop(0)) if stages and type(stages[0]) is list else ()
+    links = tuple(
+        functools.partial(_observe, tuple(stage)) if type(stage) is list else stage
+        for stage in reversed(stages)
+    )
+
+    async def run(context: "RunContext", block: "CodeBlock") -> "BlockResult":
+        for observe in leading:
+            observe(context, block)
+        next_handler = functools.partial(handler, block=block)
+        for link in links:
+            next_handler = functools.partial(
+                link, block=block, next_handler=next_handler
+            )
+        return await next_handler(context)
+
+    return run
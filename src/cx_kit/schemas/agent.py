@@ -8,8 +8,26 @@ its perception of available tools (FunctionSignature), its intentions (ToolCall)
 and its observations.
 """
 
-from pydantic import BaseModel, Field, ConfigDict  # <-- MODIFIED: Import ConfigDict
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)  # <-- MODIFIED: Import ConfigDict
+import copy
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Type, Union
+from weakref import WeakKeyDictionary
+
+from .common import TrustedModel
+
+# JSON Schemas of tool input models, generated once per model class. Keys are
+# weak so that unloading a plugin also releases its cached schemas.
+_JSON_SCHEMA_CACHE: "WeakKeyDictionary[Type[BaseModel], Dict[str, Any]]" = (
+    WeakKeyDictionary()
+)
 
 
 class FunctionSignature(BaseModel):
@@ -40,25 +58,48 @@ class FunctionSignature(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,  # Necessary to allow `Type[BaseModel]`
         populate_by_name=True,  # Allows 'parameters' to populate 'input_schema'
+        defer_build=True,
     )
     # --- MODIFICATION END ---
 
+    @property
+    def parameters_json_schema(self) -> Dict[str, Any]:
+        """
+        The JSON Schema of `input_schema`, as presented to an LLM.
+
+        It is generated on first access and then cached per model class, so
+        formatting the tool list for each request does not rebuild it. Each
+        access returns a deep copy, which callers may adapt (e.g. for an LLM
+        provider's schema dialect) without affecting other signatures.
+        """
+        schema = _JSON_SCHEMA_CACHE.get(self.input_schema)
+        if schema is None:
+            schema = self.input_schema.model_json_schema()
+            _JSON_SCHEMA_CACHE[self.input_schema] = schema
+        return copy.deepcopy(schema)
 
-class ToolCall(BaseModel):
+
+class ToolCall(TrustedModel):
     """Represents an agent's decision to call a specific function with validated arguments."""
 
     function_name: str
     parameters: Dict[str, Any]
 
+    # History entries are immutable once recorded, so they can be shared between
+    # `Beliefs` snapshots without copying.
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
-class Message(BaseModel):
+class Message(TrustedModel):
     """A single turn in an agentic conversation or thought process."""
 
     role: Literal["user", "assistant", "system", "tool"]
     content: str
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
-class Observation(BaseModel):
+
+class Observation(TrustedModel):
     """The structured result of a tool execution, to be added to the agent's memory."""
 
     tool_name: str
@@ -66,12 +107,157 @@ class Observation(BaseModel):
     output: Any
     status: Literal["success", "failure"]
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+HistoryEntry = Union[Message, Observation, ToolCall]
+
+# The `Beliefs.event_order` code for each kind of history entry.
+_MESSAGE, _OBSERVATION, _TOOL_CALL = 0, 1, 2
 
-class Beliefs(BaseModel):
+
+class Beliefs(TrustedModel):
     """
     The in-memory 'working memory' or state of an agentic process.
+
+    The history is stored as one list per entry type plus `event_order`, which
+    records the type of the k-th entry. Consumers that need a single stream
+    (e.g. prompt building over `messages`) read it directly, without scanning
+    and type-checking the others; `iter_history()` restores the full order.
+    `history` is a read-through view rather than a stored list: it supports
+    `append` and `extend`, but not item assignment, `insert` or removal.
+    Serialized, the streams are merged back into the single `history` list, so
+    the persisted shape is unchanged.
     """
 
     initial_goal: str
-    history: List[Union[Message, Observation, ToolCall]] = Field(default_factory=list)
+    messages: List[Message] = Field(default_factory=list)
+    observations: List[Observation] = Field(default_factory=list)
+    tool_calls: List[ToolCall] = Field(default_factory=list)
+    event_order: List[int] = Field(
+        default_factory=list,
+        description="The entry type of each history event, in order (0=message, 1=observation, 2=tool call).",
+    )
     facts: Dict[str, Any] = Field(default_factory=dict)
+
+    model_config = ConfigDict(defer_build=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def split_history(cls, data: Any) -> Any:
+        """Accepts the legacy single `history` list and splits it into streams."""
+        if isinstance(data, dict) and "history" in data:
+            data = dict(data)
+            streams = {"messages": [], "observations": [], "tool_calls": []}
+            order = []
+            for entry in data.pop("history"):
+                if isinstance(entry, dict):
+                    if "role" in entry:
+                        key, code = "messages", _MESSAGE
+                    elif "tool_name" in entry:
+                        key, code = "observations", _OBSERVATION
+                    else:
+                        key, code = "tool_calls", _TOOL_CALL
+                else:
+                    key, code = _STREAMS[type(entry)]
+                streams[key].append(entry)
+                order.append(code)
+            data.update(streams, event_order=order)
+        return data
+
+    @model_serializer(mode="wrap")
+    def merge_history(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        """Dumps the streams as the single, ordered `history` list."""
+        data = handler(self)
+        if not all(key in data for key in _HISTORY_FIELDS):
+            return data
+        streams = [iter(data[key]) for key in _HISTORY_FIELDS[:3]]
+        history = [next(streams[code]) for code in data["event_order"]]
+        merged = {}
+        for key, value in data.items():
+            if key == "messages":
+                merged["history"] = history
+            elif key not in _HISTORY_FIELDS:
+                merged[key] = value
+        return merged
+
+    def record(self, entry: HistoryEntry) -> None:
+        """Appends an entry to the history."""
+        key, code = _STREAMS[type(entry)]
+        getattr(self, key).append(entry)
+        self.event_order.append(code)
+
+    def iter_history(self) -> Iterator[HistoryEntry]:
+        """Yields every history entry in the order it was recorded."""
+        streams = (self.messages, self.observations, self.tool_calls)
+        positions = [0, 0, 0]
+        for code in self.event_order:
+            yield streams[code][positions[code]]
+            positions[code] += 1
+
+    @property
+    def history(self) -> "HistoryView":
+        """
+        A live, ordered view of the full history. `history.append(entry)` and
+        `history.extend(entries)` record through `record()`; other list
+        mutations are not supported and raise `AttributeError`.
+        """
+        return HistoryView(self)
+
+
+class HistoryView(Sequence):
+    """
+    The sequence returned by `Beliefs.history`.
+
+    It reads the per-type streams in recorded order and has no storage of its
+    own. Before the streams were introduced `history` was a plain list, so the
+    view keeps `append` and `extend` (routed to `Beliefs.record`) and lacks
+    every other mutator. Code that inserts, removes or replaces entries fails
+    loudly rather than changing a temporary copy.
+    """
+
+    __slots__ = ("_beliefs",)
+
+    def __init__(self, beliefs: Beliefs):
+        self._beliefs = beliefs
+
+    def __len__(self) -> int:
+        return len(self._beliefs.event_order)
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        return self._beliefs.iter_history()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        order = self._beliefs.event_order
+        code = order[index]
+        position = order[: index % len(order)].count(code)
+        return getattr(self._beliefs, _HISTORY_FIELDS[code])[position]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (HistoryView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self)!r})"
+
+    def append(self, entry: HistoryEntry) -> None:
+        """Records `entry` at the end of the history."""
+        self._beliefs.record(entry)
+
+    def extend(self, entries: Iterable[HistoryEntry]) -> None:
+        """Records each of `entries`, in order, at the end of the history."""
+        for entry in entries:
+            self._beliefs.record(entry)
+
+
+# The serialized stream fields, in `event_order` code order, then the index.
+_HISTORY_FIELDS = ("messages", "observations", "tool_calls", "event_order")
+
+_STREAMS = {
+    Message: ("messages", _MESSAGE),
+    Observation: ("observations", _OBSERVATION),
+    ToolCall: ("tool_calls", _TOOL_CALL),
+}
@@ -1,4 +1,4 @@
-# cx-kit/src/cx_kit/schemas/api_catalog.py
+# cx-kit/src/cx_kit/schemas/blueprint.py
 
 """
 Defines the Pydantic models for the ApiCatalog, also known as a "Blueprint".
@@ -8,9 +8,17 @@ most importantly, specifies which `Capability` plugin is responsible for
 interacting with it.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Any, Dict, List, Literal, Optional
 
+__all__ = [
+    "ApiCatalog",
+    "AuthField",
+    "Blueprint",
+    "SupportedAuthMethod",
+    "validate_blueprints",
+]
+
 
 class AuthField(BaseModel):
     """Defines a single field for the interactive connection wizard."""
@@ -26,6 +34,8 @@ class AuthField(BaseModel):
         False, description="If true, the input will be masked in the UI."
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class SupportedAuthMethod(BaseModel):
     """Describes a complete authentication method that a blueprint supports."""
@@ -41,6 +51,8 @@ class SupportedAuthMethod(BaseModel):
         ..., description="A list of fields to collect from the user."
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Blueprint(BaseModel):
     """
@@ -67,3 +79,23 @@ class Blueprint(BaseModel):
         default_factory=dict,
         description="A flexible dictionary for capability-specific configurations.",
     )
+
+    model_config = ConfigDict(defer_build=True)
+
+
+# `ApiCatalog` is the legacy name for a Blueprint. It is an alias of the same
+# class rather than a duplicate model, so code and entry-point strings that still
+# use the old name resolve without a second core-schema build.
+ApiCatalog = Blueprint
+
+
+# Built once and shared, so discovery validates every blueprint of a file in one
+# call. Like the models, its core schema is built on first use.
+_BLUEPRINT_LIST_ADAPTER: TypeAdapter[List[Blueprint]] = TypeAdapter(
+    List[Blueprint], config=ConfigDict(defer_build=True)
+)
+
+
+def validate_blueprints(data: List[Dict[str, Any]]) -> List[Blueprint]:
+    """Validates a list of raw blueprint dictionaries (e.g. parsed YAML) in one call."""
+    return _BLUEPRINT_LIST_ADAPTER.validate_python(data)
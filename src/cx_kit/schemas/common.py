@@ -0,0 +1,246 @@
+# cx-kit/src/cx_kit/schemas/common.py
+
+"""
+Shared, low-level building blocks used across the schema modules.
+"""
+
+import copy
+import functools
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Literal,
+    NoReturn,
+    Optional,
+    Self,
+    Tuple,
+    get_origin,
+)
+
+from pydantic import BaseModel, BeforeValidator
+from pydantic_core import PydanticUndefined
+
+# When False, every `from_trusted` call runs full validation instead. Test suites
+# flip this off so bugs in server-internal producers surface in CI.
+TRUSTED_CONSTRUCT = True
+
+
+class FrozenDict(dict):
+    """
+    A read-only `dict`. Any attempt to mutate it raises a `TypeError`.
+
+    It subclasses `dict` (rather than wrapping a `MappingProxyType`) so Pydantic
+    serializes it like any other dictionary field.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    # The default `dict` protocols rebuild the copy by item assignment, which
+    # is blocked; pass the contents to the constructor instead.
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return type(self)(copy.deepcopy(dict(self), memo))
+
+
+# A single, shared empty mapping for `Dict` fields of frozen models. Declaring
+# such a field with `default_factory=empty_dict` means unset fields no longer
+# allocate a fresh dict per instance. Fields that callers may mutate in place
+# keep `default_factory=dict`: a defaulted value would otherwise be read-only
+# while a passed-in one is not.
+EMPTY_DICT = FrozenDict()
+
+
+def empty_dict() -> FrozenDict:
+    """The `default_factory` for dictionary fields of frozen models."""
+    return EMPTY_DICT
+
+
+_UTC = timezone.utc
+
+
+def utc_now() -> datetime:
+    """The shared `default_factory` for timezone-aware UTC timestamp fields."""
+    return datetime.now(_UTC)
+
+
+# The (monotonic ~1 ms bucket, timestamp) pair last returned by `coarse_utc_now`,
+# kept as one tuple so concurrent callers never see a torn update.
+_coarse_now = (-1, datetime.min.replace(tzinfo=_UTC))
+
+
+def coarse_utc_now() -> datetime:
+    """
+    Like `utc_now`, but every call within the same ~1 ms window (2**20 ns)
+    returns the same `datetime` object.
+
+    For records loaded or created in bulk (e.g. every connection file at
+    startup), where sub-millisecond precision is meaningless: it reads the cheap
+    monotonic clock and only builds a new `datetime` once per window.
+    """
+    global _coarse_now
+    bucket = time.monotonic_ns() >> 20
+    cached_bucket, timestamp = _coarse_now
+    if bucket != cached_bucket:
+        timestamp = datetime.now(_UTC)
+        _coarse_now = (bucket, timestamp)
+    return timestamp
+
+
+# Event IDs are a random, per-process 96-bit prefix (with the UUIDv4 version and
+# variant bits already set) plus a 32-bit counter: no `os.urandom` syscall per
+# event. The prefix is re-rolled whenever the counter wraps, and in a forked
+# child so it can't repeat its parent's IDs.
+_EVENT_ID_COUNTER_BITS = 0xFFFFFFFF
+
+
+def _reseed_event_ids() -> None:
+    global _event_ids
+    # One (prefix, counter) tuple, so a caller never pairs one prefix with
+    # the other's counter.
+    _event_ids = (
+        uuid.uuid4().int & ~_EVENT_ID_COUNTER_BITS,
+        iter(range(_EVENT_ID_COUNTER_BITS + 1)),
+    )
+
+
+_reseed_event_ids()
+# Not available on Windows, which has no `fork`.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_event_ids)
+
+
+def next_event_id() -> uuid.UUID:
+    """The `default_factory` for high-frequency event IDs. Unique per process."""
+    prefix, counter = _event_ids
+    value = next(counter, None)
+    if value is None:
+        _reseed_event_ids()
+        prefix, counter = _event_ids
+        value = next(counter)
+    return uuid.UUID(int=prefix | value)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# A `str` drawn from a small, repeating vocabulary (capability IDs, event types,
+# sources). Values are interned on validation, so every occurrence shares one
+# object and equality checks short-circuit on identity. `Literal` fields do not
+# need this: Pydantic already returns the schema's own constant for them.
+InternedStr = Annotated[str, BeforeValidator(_intern)]
+
+
+# Marks a field without a default in `TrustedModel._trusted_fields`.
+_REQUIRED = object()
+
+# Types whose defaults can be shared between instances instead of copied.
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+_object_setattr = object.__setattr__
+
+
+class TrustedModel(BaseModel):
+    """
+    Base class for models the server builds in bulk from its own data, such as
+    emitted events and agent history entries.
+    """
+
+    # Per subclass: each field's name, its static default (or `_REQUIRED`), its
+    # default factory, and whether it is typed as a `Literal` (e.g. `role` or
+    # `level`). Computed once so `from_trusted` does no per-call introspection.
+    _trusted_fields: ClassVar[
+        Tuple[Tuple[str, Any, Optional[Callable[[], Any]], bool], ...]
+    ] = ()
+    _trusted_extra: ClassVar[bool] = False
+    # False if a default factory takes the validated data; such models fall back
+    # to `model_construct`.
+    _trusted_fast: ClassVar[bool] = True
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        trusted_fields = []
+        cls._trusted_fast = True
+        for name, field in cls.model_fields.items():
+            default, factory = field.default, field.default_factory
+            if factory is not None:
+                if field.default_factory_takes_validated_data:
+                    cls._trusted_fast = False
+            elif default is PydanticUndefined:
+                default = _REQUIRED
+            elif not isinstance(default, _IMMUTABLE_DEFAULTS):
+                factory = functools.partial(copy.deepcopy, default)
+            is_literal = get_origin(field.annotation) is Literal
+            trusted_fields.append((name, default, factory, is_literal))
+        cls._trusted_fields = tuple(trusted_fields)
+        cls._trusted_extra = cls.model_config.get("extra") == "allow"
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """
+        Builds an instance without validation, coercion or alias handling, like
+        `model_construct`. Defaults are still applied.
+
+        The cost is constant per field, whatever the values hold, so it pays off
+        when fields carry containers (event `fields`, exported variables, ...)
+        that validation would walk and copy. For a model with a couple of small
+        scalar fields the validating constructor is about as fast.
+
+        Only use this for values produced by server-internal code. Fields must be
+        passed by their Python name, and nested models as model instances rather
+        than dicts. Data arriving from clients or files goes through the normal
+        constructor or `model_validate`.
+        """
+        if not TRUSTED_CONSTRUCT:
+            return cls(**data)
+        if not cls._trusted_fast:
+            return cls.model_construct(**data)
+        # `model_construct` re-inspects every default factory's signature on each
+        # call, which costs more than validating; the field table avoids that.
+        values = {}
+        fields_set = set()
+        for name, default, factory, is_literal in cls._trusted_fields:
+            if name in data:
+                fields_set.add(name)
+                value = data[name]
+                # Validation would swap `Literal` values for the schema's own
+                # constants; interning gives these instances the same objects.
+                if is_literal and type(value) is str:
+                    value = sys.intern(value)
+                values[name] = value
+            elif factory is not None:
+                values[name] = factory()
+            elif default is not _REQUIRED:
+                values[name] = default
+        extra = None
+        if cls._trusted_extra and len(fields_set) != len(data):
+            extra = {k: v for k, v in data.items() if k not in fields_set}
+
+        instance = cls.__new__(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(instance, "__pydantic_extra__", extra)
+        _object_setattr(instance, "__pydantic_private__", None)
+        if cls.__pydantic_post_init__:
+            instance.model_post_init(None)
+        return instance
@@ -8,11 +8,12 @@ These models are the Python representation of the canonical TypeScript contracts
 from __future__ import annotations
 import uuid
 from typing import Any, Dict, Literal, Optional
-from datetime import datetime, timezone
+from datetime import datetime
 
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from .common import TrustedModel, next_event_id, utc_now
 from .document import ParsedDocument
 
 # ==============================================================================
@@ -20,26 +21,34 @@ from .document import ParsedDocument
 # ==============================================================================
 
 
-class ServerEventPayload(BaseModel):
+class ServerEventPayload(TrustedModel):
     level: Literal["debug", "info", "warn", "error"]
     message: str
     fields: Optional[Dict[str, Any]] = None
 
+    # Events are immutable once emitted; the same instance may be fanned out to
+    # several sinks.
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
-class ServerEvent(BaseModel):
+
+class ServerEvent(TrustedModel):
     trace_id: uuid.UUID
-    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    id: uuid.UUID = Field(default_factory=next_event_id)
     type: str
     source: str = "/cx-server"
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=utc_now)
     payload: ServerEventPayload
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class ClientCommand(BaseModel):
     trace_id: uuid.UUID
     type: str
     payload: Dict[str, Any]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # ==============================================================================
 # SCP Payload Schemas (Client -> Server)
@@ -49,26 +58,32 @@ class ClientCommand(BaseModel):
 class PageLoadPayload(BaseModel):
     page_id: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class BlockRunPayload(BaseModel):
     page_id: str
     block_id: str
     content_override: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # ==============================================================================
 # SEP `fields` Schemas (Server -> Client)
 # ==============================================================================
 
 
-class BlockOutput(BaseModel):
+class BlockOutput(TrustedModel):
     """Represents a renderable output, either as inline SDUI or a data reference."""
 
     inline_data: Optional[Dict[str, Any]] = None  # This would be a ComponentNode model
     data_ref: Optional[Dict[str, Any]] = None  # This would be a DataRef model
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
-class BlockOutputFields(BaseModel):
+class BlockOutputFields(TrustedModel):
     """The 'Render-Delta' payload for a successful block execution."""
 
     block_id: str
@@ -78,8 +93,12 @@ class BlockOutputFields(BaseModel):
     targeted_outputs: Optional[Dict[str, BlockOutput]] = None
     context_updates: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(defer_build=True)
 
-class PageLoadedFields(BaseModel):
+
+class PageLoadedFields(TrustedModel):
     page_id: str
     content: str
     document: ParsedDocument
+
+    model_config = ConfigDict(defer_build=True)
@@ -6,12 +6,14 @@ information to the WorkflowEngine and Capabilities during execution.
 """
 
 from __future__ import annotations
-from pydantic import BaseModel, Field, ConfigDict
+import asyncio
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from typing import Any, Dict, Optional, TYPE_CHECKING
 from pathlib import Path
 
 # Import the new ConnectionSpec for type hinting
 from .connection import ConnectionSpec
+from .common import InternedStr
 
 if TYPE_CHECKING:
     from ..toolkit.services import VfsService, SecretService, LlmService
@@ -27,9 +29,10 @@ class RunContext(BaseModel):
     new, updated context for the next step.
     """
 
-    # Core Identifiers for tracing and asset resolution
-    run_id: str
-    flow_id: str
+    # Core Identifiers for tracing and asset resolution. Interned, since every
+    # step's context (and every event it emits) carries the same values.
+    run_id: InternedStr
+    flow_id: InternedStr
 
     # Paths and Filesystem Context
     cx_home: Path
@@ -53,7 +56,14 @@ class RunContext(BaseModel):
     secrets: "SecretService" = Field(exclude=True)
     llm: "LlmService" = Field(exclude=True)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+    # Secrets fetched by `ConnectionSecrets`, keyed by connection ID. Contexts
+    # derived with `with_updates` share this dict, so each connection's secrets
+    # are requested from the `SecretService` once per run rather than per step.
+    _secrets_cache: Dict[str, asyncio.Future] = PrivateAttr(default_factory=dict)
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, frozen=True, defer_build=True
+    )
 
     def with_updates(
         self,
@@ -70,9 +80,7 @@ class RunContext(BaseModel):
         update_dict = {}
 
         if new_variables:
-            updated_vars = self.variables.copy()
-            updated_vars.update(new_variables)
-            update_dict["variables"] = updated_vars
+            update_dict["variables"] = {**self.variables, **new_variables}
 
         # --- THIS IS THE CRITICAL ADDITION ---
         # Allow the `active_connection` to be set for the new context.
@@ -8,11 +8,19 @@ document's composition of narrative and code, but not the computational meaning
 of the code itself.
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Literal, Optional, Type, Union, get_args
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-# A type hint for the union of possible block types.
-DocumentBlock = Union["MarkdownBlock", "CodeBlock"]
+from . import common
+from .common import empty_dict
+
+# A type hint for the union of possible block types. It is tagged on `type`, so
+# validating a block is one lookup of its tag rather than trying each variant in
+# turn. Raw block dicts must therefore carry their `type` (as `model_dump()`
+# output always does).
+DocumentBlock = Annotated[
+    Union["MarkdownBlock", "CodeBlock"], Field(discriminator="type")
+]
 
 
 class MarkdownBlock(BaseModel):
@@ -21,6 +29,8 @@ class MarkdownBlock(BaseModel):
     type: Literal["markdown"] = "markdown"
     content: str = Field(..., description="The raw Markdown content of the block.")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class CodeBlock(BaseModel):
     """
@@ -33,7 +43,7 @@ class CodeBlock(BaseModel):
     )
     content: str = Field(..., description="The raw CXQL source code within the block.")
     attributes: Dict[str, Any] = Field(
-        default_factory=dict,
+        default_factory=empty_dict,
         description="A dictionary of attributes parsed from the block's info string, e.g., {'hidden': True}.",
     )
     start_line: int = Field(
@@ -41,6 +51,8 @@ class CodeBlock(BaseModel):
         description="The 1-based line number where this block starts in the source file.",
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class ParsedDocument(BaseModel):
     """
@@ -49,15 +61,83 @@ class ParsedDocument(BaseModel):
     """
 
     frontmatter: Dict[str, Any] = Field(
-        default_factory=dict, description="YAML frontmatter from the top of the file."
+        default_factory=empty_dict,
+        description="YAML frontmatter from the top of the file.",
     )
     blocks: List[DocumentBlock] = Field(
         default_factory=list,
         description="A sequential list of all markdown and code blocks.",
     )
 
+    # Parsed documents are immutable snapshots of a file. Validators are built on
+    # first use (or by `warmup()`) rather than at import time.
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "ParsedDocument":
+        """
+        Rebuilds a ParsedDocument from an already-validated payload (e.g. the
+        `model_dump()` output stored in a cache, passed as
+        `ParsedDocument.from_trusted(**cached)`) without re-running validation.
+
+        Each block is dispatched on its `type` tag straight to the concrete block
+        class and built with `model_construct`. The input MUST come from a trusted,
+        previously-validated source; no checks of any kind are performed unless
+        `common.TRUSTED_CONSTRUCT` is turned off.
+        """
+        if not common.TRUSTED_CONSTRUCT:
+            return cls.model_validate(data)
+        values = data
+        if "blocks" in values:
+            values["blocks"] = [build_block(block) for block in values["blocks"]]
+        return cls.model_construct(**values)
+
+
+def warmup() -> None:
+    """
+    Builds the deferred validators for the document schemas.
+
+    These models use `defer_build=True`, so importing the SDK does not pay for
+    their core schemas. Hosts should call this once at first document load (or
+    at startup) to take that cost at a predictable point. It also resolves the
+    `DocumentBlock` forward references.
+    """
+    MarkdownBlock.model_rebuild()
+    CodeBlock.model_rebuild()
+    ParsedDocument.model_rebuild()
+
+
+# Maps each block's `type` Literal value to its class, computed once at import.
+BLOCK_REGISTRY: Dict[str, Type[Union[MarkdownBlock, CodeBlock]]] = {
+    get_args(block_cls.model_fields["type"].annotation)[0]: block_cls
+    for block_cls in (MarkdownBlock, CodeBlock)
+}
+
+
+def build_block(data: Dict[str, Any]) -> DocumentBlock:
+    """
+    Builds a block from a trusted dictionary with a single registry lookup on its
+    `type` tag and no validation. Use `validate_block` for untrusted input.
+    """
+    return BLOCK_REGISTRY[data["type"]].model_construct(**data)
+
+
+# Built once so parsers can validate raw block dicts in a hot loop without going
+# through the `ParsedDocument` wrapper each time. The adapters defer their own
+# core-schema build too, so importing this module stays cheap.
+_BLOCK_ADAPTER: TypeAdapter[DocumentBlock] = TypeAdapter(
+    DocumentBlock, config=ConfigDict(defer_build=True)
+)
+_BLOCK_LIST_ADAPTER: TypeAdapter[List[DocumentBlock]] = TypeAdapter(
+    List[DocumentBlock], config=ConfigDict(defer_build=True)
+)
+
+
+def validate_block(data: Dict[str, Any]) -> DocumentBlock:
+    """Validates a single raw block dictionary into a `MarkdownBlock` or `CodeBlock`."""
+    return _BLOCK_ADAPTER.validate_python(data)
+
 
-# This is a forward reference update required by Pydantic v2.
-# It helps the type hint `DocumentBlock` resolve the class names.
-MarkdownBlock.model_rebuild()
-CodeBlock.model_rebuild()
+def validate_blocks(data: List[Dict[str, Any]]) -> List[DocumentBlock]:
+    """Validates a list of raw block dictionaries in a single call."""
+    return _BLOCK_LIST_ADAPTER.validate_python(data)
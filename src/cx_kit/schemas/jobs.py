@@ -8,8 +8,10 @@ package, dispatch, and monitor jobs on remote compute infrastructure
 like Kubernetes or Knative.
 """
 
-from pydantic import BaseModel, Field
-from typing import Any, Dict, Literal, Optional
+import functools
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Any, Dict, Literal, Optional, Union
 
 
 class JobPayload(BaseModel):
@@ -46,6 +48,21 @@ class JobPayload(BaseModel):
     executor_params: Dict[str, Any] = Field(default_factory=dict)
 
 
+# Built once at import and reused for every dispatch. `dump_json` writes bytes
+# directly instead of going through `model_dump_json()` and `.encode()`.
+_JOB_ADAPTER: TypeAdapter[JobPayload] = TypeAdapter(JobPayload)
+
+
+def job_to_bytes(job: JobPayload) -> bytes:
+    """Serializes a `JobPayload` to the JSON bytes sent to a remote executor."""
+    return _JOB_ADAPTER.dump_json(job)
+
+
+def job_from_bytes(data: bytes) -> JobPayload:
+    """Validates a `JobPayload` straight from JSON bytes, e.g. on a remote worker."""
+    return _JOB_ADAPTER.validate_json(data)
+
+
 class JobHandle(BaseModel):
     """
     A handle or "tracking number" returned immediately after a job is dispatched.
@@ -71,3 +88,30 @@ class JobStatus(BaseModel):
     message: Optional[str] = Field(None, description="A human-readable status message.")
     start_time: Optional[str] = None
     completion_time: Optional[str] = None
+
+    # Status snapshots are immutable, so `parse_job_status` can hand the same
+    # instance to every caller that receives identical bytes.
+    model_config = ConfigDict(frozen=True)
+
+
+_JOB_STATUS_ADAPTER: TypeAdapter[JobStatus] = TypeAdapter(JobStatus)
+
+
+def parse_job_status(data: Union[bytes, bytearray, memoryview]) -> JobStatus:
+    """
+    Validates a job status report from its raw JSON bytes.
+
+    Orchestrators poll running jobs repeatedly and mostly receive the same
+    report each time, so results are cached on the exact bytes: a repeated
+    report costs a cache lookup instead of a validation. Invalid input raises
+    `ValidationError` and is not cached. Mutable buffers (`bytearray`,
+    `memoryview`) are copied to `bytes` to be used as the cache key.
+    """
+    if type(data) is not bytes:
+        data = bytes(data)
+    return _parse_job_status(data)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_job_status(data: bytes) -> JobStatus:
+    return _JOB_STATUS_ADAPTER.validate_json(data)
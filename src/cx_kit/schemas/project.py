@@ -13,6 +13,8 @@ from pydantic import (
     ConfigDict,
 )  # <-- MODIFIED: Import ConfigDict
 
+from .common import InternedStr
+
 # ==============================================================================
 # SECTION 1: DOCUMENT & LEGACY BLOCK SCHEMAS
 # ==============================================================================
@@ -29,7 +31,7 @@ class Block(BaseModel):
     name: Optional[str] = Field(
         None, description="A human-readable name for the block."
     )
-    engine: Optional[str] = Field(
+    engine: Optional[InternedStr] = Field(
         None, description="The capability_id for a connection-less capability."
     )
     connection: Optional[str] = Field(
@@ -63,7 +65,10 @@ class Block(BaseModel):
     # --- MODIFICATION START ---
     model_config = ConfigDict(
         populate_by_name=True,  # Allows using the alias 'if' for 'if_condition'
-        extra="allow",  # Allows private attributes like `_shell_directives`
+        # Unknown keys are dropped. The private attributes above do not need
+        # `extra="allow"`; they live outside the validated fields.
+        extra="ignore",
+        defer_build=True,
     )
     # --- MODIFICATION END ---
 
@@ -76,6 +81,8 @@ class DocumentInput(BaseModel):
     required: bool = False
     default: Optional[Any] = None
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class Document(BaseModel):
     """
@@ -90,18 +97,23 @@ class Document(BaseModel):
     author: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # ==============================================================================
 # SECTION 2: PROJECT MANIFEST & LOCKFILE SCHEMAS
 # ==============================================================================
 
 
-# These schemas are still relevant and do not require ConfigDict as they have no special config.
+# These schemas are still relevant. Like every model in this module, they build
+# their validators on first use rather than at import time.
 class EnvironmentSpec(BaseModel):
     """Defines system-level dependencies for a project's environment."""
 
     packages: List[str] = Field(default_factory=list)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PythonToolsSpec(BaseModel):
     """Defines Python-specific tooling and dependencies."""
@@ -110,18 +122,24 @@ class PythonToolsSpec(BaseModel):
         None, description="Path to a requirements.txt file."
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ToolingSpec(BaseModel):
     """Container for all language-specific tooling configurations."""
 
     python: Optional[PythonToolsSpec] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class SyncropelSpec(BaseModel):
     """Defines Syncropel-native dependencies for the project."""
 
     apps: Dict[str, str] = Field(default_factory=dict)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ProjectManifest(BaseModel):
     """The definitive schema for the `cx.project.yaml` file."""
@@ -130,6 +148,8 @@ class ProjectManifest(BaseModel):
     tools: Optional[ToolingSpec] = None
     syncropel: Optional[SyncropelSpec] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class LockedPackage(BaseModel):
     """Defines the exact, resolved state of a single Syncropel application package."""
@@ -138,9 +158,13 @@ class LockedPackage(BaseModel):
     source: str
     integrity: str
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class Lockfile(BaseModel):
     """The definitive schema for the `cx.lock.json` file."""
 
     metadata: Dict[str, str] = Field(default_factory=dict)
     packages: Dict[str, LockedPackage]
+
+    model_config = ConfigDict(defer_build=True)
@@ -7,11 +7,13 @@ the results of CXQL block evaluations.
 This module is CRITICAL to the native CXQL runtime and the client-server architecture.
 """
 
-from pydantic import BaseModel, Field, ConfigDict  # <-- MODIFIED: Import ConfigDict
+from pydantic import Field, ConfigDict
 from typing import Any, List, Dict, Optional
 
+from .common import TrustedModel
 
-class ArtifactSpec(BaseModel):
+
+class ArtifactSpec(TrustedModel):
     """
     A declarative record of a single file created by a Capability.
     This information is used by the DocumentOrchestrator to populate the final RunManifest.
@@ -26,11 +28,16 @@ class ArtifactSpec(BaseModel):
         description="The semantic role of the artifact (e.g., 'primary_output', 'log_file', 'visualization').",
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
-class StepResult(BaseModel):
+class StepResult(TrustedModel):
     """
     The standard, structured return object for all `BaseCapability.execute_function` methods.
     It cleanly separates the primary data payload from side-effects.
+
+    Capabilities should build results from their own, already well-typed values
+    with `StepResult.from_trusted(...)`, which skips validation.
     """
 
     data: Any = Field(
@@ -46,14 +53,19 @@ class StepResult(BaseModel):
         description="An open dictionary for the capability to pass additional, non-piped metadata back to the orchestrator.",
     )
 
+    model_config = ConfigDict(defer_build=True)
 
-class BlockResult(BaseModel):
+
+class BlockResult(TrustedModel):
     """
     The definitive result of executing a single CXQL code block.
 
     This object is the primary communication contract between the WorkflowEngine
     and the DocumentOrchestrator. It encapsulates the complete "delta" of changes
     resulting from a block's execution.
+
+    The engine builds one per executed block from its own state, so it uses
+    `BlockResult.from_trusted(...)` rather than the validating constructor.
     """
 
     output_value: Optional[Any] = Field(
@@ -78,6 +90,7 @@ class BlockResult(BaseModel):
     model_config = ConfigDict(
         # Allows for complex, non-Pydantic types (like DataFrames) in the output_value
         # before they are serialized by a renderer.
-        arbitrary_types_allowed=True
+        arbitrary_types_allowed=True,
+        defer_build=True,
     )
     # --- MODIFICATION END ---
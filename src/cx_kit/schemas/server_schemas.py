@@ -12,13 +12,23 @@ It covers:
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict, PrivateAttr
 
-# Import the canonical workflow schemas from within the cx-kit SDK
-from .workflow import ContextualPage
+from .common import InternedStr, TrustedModel
+from .document import ParsedDocument
+
+
+def _stringify_id(value: Any) -> Any:
+    """Accepts `UUID` objects from producers that still pass them instead of `str`."""
+    return str(value) if isinstance(value, UUID) else value
+
+
+# Trace and event IDs are opaque strings on the wire. Producers should call
+# `str(uuid4())` once at emit time; validation is then a plain `str` check.
+MessageId = Annotated[str, BeforeValidator(_stringify_id)]
 
 # ========================================================================
 #   SECTION 1: COMMAND PROTOCOL (Client -> Server) - SCP v1.1
@@ -28,19 +38,16 @@ from .workflow import ContextualPage
 class ScpMessage(BaseModel):
     """The definitive structure for all client-to-server messages (commands)."""
 
-    trace_id: Union[str, UUID] = Field(
-        ..., description="Client-generated ID for the entire user action (trace)."
+    trace_id: MessageId = Field(
+        ...,
+        alias="command_id",
+        description="Client-generated ID for the entire user action (trace).",
     )
-    type: str = Field(
+    type: InternedStr = Field(
         ..., description="The command type, using a <NOUN>.<VERB> convention."
     )
     payload: Dict[str, Any] = Field(..., description="The command-specific parameters.")
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=lambda field_name: "command_id"
-        if field_name == "trace_id"
-        else field_name,
-    )
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 # --- SCP Payload Schemas ---
@@ -49,10 +56,14 @@ class ScpMessage(BaseModel):
 class WorkspaceBrowsePayload(BaseModel):
     path: str = Field("/", description="The logical workspace path to browse.")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PageLoadPayload(BaseModel):
     page_id: str = Field(..., description="The namespaced ID of the page to load.")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PageSavePayload(BaseModel):
     uri: str = Field(..., description="The VFS URI of the page to save.")
@@ -62,6 +73,8 @@ class PageSavePayload(BaseModel):
         description="The last-modified timestamp of the file when the client loaded it, for conflict detection.",
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class BlockRunPayload(BaseModel):
     page_id: str
@@ -71,11 +84,15 @@ class BlockRunPayload(BaseModel):
         None, description="The current 'dirty' content from the client's editor."
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PageRunPayload(BaseModel):
     page_id: str
     parameters: Dict[str, Any] = Field(default_factory=dict)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class CommandExecutePayload(BaseModel):
     command_text: str
@@ -83,6 +100,8 @@ class CommandExecutePayload(BaseModel):
         None, description="The ID of the active page, providing CWD context."
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AgentPromptPayload(BaseModel):
     prompt: str
@@ -90,13 +109,15 @@ class AgentPromptPayload(BaseModel):
     notebook_context_id: Optional[str] = None
     context_paths: Optional[List[str]] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # ========================================================================
 #   SECTION 2: EVENT PROTOCOL (Server -> Client) - SEP v1.1
 # ========================================================================
 
 
-class SepPayload(BaseModel):
+class SepPayload(TrustedModel):
     """The main payload of any server-to-client event."""
 
     level: Literal["debug", "info", "warn", "error"]
@@ -106,37 +127,54 @@ class SepPayload(BaseModel):
     )
     labels: Dict[str, str] = Field(default_factory=dict)
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class SepMessage(BaseModel):
+class SepMessage(TrustedModel):
     """The definitive structure for all server-to-client messages (events)."""
 
-    trace_id: Union[str, UUID]
-    event_id: Union[str, UUID]
-    type: str
-    source: str
+    trace_id: MessageId = Field(..., alias="command_id")
+    event_id: MessageId = Field(..., alias="id")
+    type: InternedStr
+    source: InternedStr
     timestamp: datetime
     payload: SepPayload
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=lambda field_name: "command_id"
-        if field_name == "trace_id"
-        else "id"
-        if field_name == "event_id"
-        else field_name,
-    )
+
+    # The serialized wire bytes, cached by `wire.encode_event` on first use so a
+    # broadcast to many clients serializes the message only once. Reassigning a
+    # field or copying with `update` drops them; mutating the nested `payload`
+    # in place does not, so emitters must finish it before encoding.
+    _cached_json: Optional[bytes] = PrivateAttr(None)
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in SepMessage.model_fields:
+            self._cached_json = None
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "SepMessage":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._cached_json = None
+        return copied
 
 
 # --- SEP `fields` Schemas: Core UI & SDUI ---
 
 
-class SduiPayload(BaseModel):
+class SduiPayload(TrustedModel):
     """The base schema for any Syncropel Declarative UI (SDUI) component."""
 
     ui_component: str
     props: Dict[str, Any] = Field(default_factory=dict)
 
+    model_config = ConfigDict(defer_build=True)
 
-class DataRef(BaseModel):
+
+class DataRef(TrustedModel):
     """The 'Claim Check' for a large data artifact."""
 
     artifact_id: str
@@ -144,13 +182,17 @@ class DataRef(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     access_url: str
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
-class BlockOutput(BaseModel):
+class BlockOutput(TrustedModel):
     """The container for a block's result, implementing the Hybrid Claim Check pattern."""
 
     inline_data: Optional[SduiPayload] = None
     data_ref: Optional[DataRef] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # --- SEP `fields` Schemas: Event-Specific Payloads ---
 
@@ -159,25 +201,33 @@ class SessionStateFields(BaseModel):
     connections: List[Dict[str, str]]
     variables: List[Dict[str, str]]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class CommandResultFields(BaseModel):
     result: Any
     new_session_state: Optional[SessionStateFields] = None
 
+    model_config = ConfigDict(defer_build=True)
 
-class BlockStatusFields(BaseModel):
+
+class BlockStatusFields(TrustedModel):
     block_id: str
     status: Literal["running", "pending", "skipped"]
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class BlockOutputFields(BaseModel):
+class BlockOutputFields(TrustedModel):
     block_id: str
     status: Literal["success"]
     duration_ms: int
     output: BlockOutput
 
+    model_config = ConfigDict(defer_build=True)
 
-class BlockErrorFields(BaseModel):
+
+class BlockErrorFields(TrustedModel):
     block_id: str
     status: Literal["error"]
     duration_ms: int
@@ -186,25 +236,31 @@ class BlockErrorFields(BaseModel):
         description="A structured error object with 'message' and optional 'traceback'.",
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PageLoadedFields(BaseModel):
     uri: str
     content: str
-    initial_model: ContextualPage
+    initial_model: ParsedDocument
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class PageSavedFields(BaseModel):
     uri: str
     name: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AgentSuggestedCommand(BaseModel):
     """A fully-formed SCP message that the agent suggests the client send."""
 
-    trace_id: Union[str, UUID] = Field(..., alias="command_id")
+    trace_id: MessageId = Field(..., alias="command_id")
     type: str
     payload: Dict[str, Any]
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class AgentResponseAction(BaseModel):
@@ -214,9 +270,13 @@ class AgentResponseAction(BaseModel):
     label: str
     command: AgentSuggestedCommand
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AgentResponseFields(BaseModel):
     """The definitive structure for the `payload.fields` of an AGENT.RESPONSE event."""
 
     content: str  # Markdown formatted
     actions: List[AgentResponseAction] = Field(default_factory=list)
+
+    model_config = ConfigDict(defer_build=True)
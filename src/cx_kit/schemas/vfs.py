@@ -6,9 +6,11 @@ and the structure of the final, auditable Run Manifest.
 """
 
 from pydantic import BaseModel, Field, ConfigDict  # <-- MODIFIED: Import ConfigDict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 from datetime import datetime
 
+from .common import empty_dict
+
 
 class VfsReference(BaseModel):
     """
@@ -37,7 +39,7 @@ class VfsReference(BaseModel):
 
     # --- MODIFICATION START ---
     # Replaced the deprecated `class Config` with `model_config`.
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True, defer_build=True)
     # --- MODIFICATION END ---
 
 
@@ -49,7 +51,7 @@ class ManifestStepResult(BaseModel):
     """
 
     step_id: str
-    status: str = Field(
+    status: Literal["success", "failed", "skipped"] = Field(
         ..., description="The final status: 'success', 'failed', or 'skipped'."
     )
     summary: Optional[str] = Field(
@@ -66,6 +68,8 @@ class ManifestStepResult(BaseModel):
         None, description="A content hash of the step's primary `data` output."
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ManifestArtifact(BaseModel):
     """Metadata for a single artifact produced by a run, for the RunManifest."""
@@ -76,13 +80,19 @@ class ManifestArtifact(BaseModel):
     type: str = Field(
         "primary_output", description="The semantic type of the artifact."
     )
-    tags: Dict[str, Any] = Field(default_factory=dict)
+    tags: Dict[str, Any] = Field(default_factory=empty_dict)
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
-class RunManifest(BaseModel):
+
+class RunManifestSummary(BaseModel):
     """
-    The complete, auditable record of a single workflow execution.
-    This is the definitive "receipt" that is saved to disk after every run.
+    The header of a `RunManifest`: everything except the per-step results and
+    the artifact index.
+
+    Run listings and summaries only need these fields. Loading a saved manifest
+    with `load_manifest_summary` skips validating its (potentially thousands of)
+    step and artifact records entirely.
     """
 
     run_id: str
@@ -95,5 +105,26 @@ class RunManifest(BaseModel):
     parameters: Dict[str, Any] = Field(
         ..., description="The input parameters provided for this run."
     )
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class RunManifest(RunManifestSummary):
+    """
+    The complete, auditable record of a single workflow execution.
+    This is the definitive "receipt" that is saved to disk after every run.
+    """
+
     steps: List[ManifestStepResult]
     artifacts: Dict[str, ManifestArtifact] = Field(default_factory=dict)
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def load_manifest_summary(data: Union[str, bytes]) -> RunManifestSummary:
+    """
+    Reads only the header of a saved manifest's JSON. The `steps` and
+    `artifacts` are skipped as unknown keys instead of being validated; use
+    `RunManifest.model_validate_json` when the full record is needed.
+    """
+    return RunManifestSummary.model_validate_json(data)
@@ -0,0 +1,391 @@
+# cx-kit/src/cx_kit/schemas/wire.py
+
+"""
+Provides the fast encode/decode path for SCP and SEP messages at the WebSocket boundary.
+
+Inbound commands are decoded straight from raw bytes into `msgspec.Struct` shadows
+of the Pydantic models, and outbound events are serialized through a single, reused
+`msgspec` encoder. The Pydantic models in `server_schemas` remain the authoring API
+and the validation contract for external (HTTP) APIs; this module is only meant to
+be used by the socket transport.
+
+`msgspec` is an optional dependency (`pip install cx-kit[fast]`). When it is not
+installed, every function here falls back to the equivalent Pydantic JSON path, so
+callers never need to branch on its availability.
+"""
+
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Literal, NamedTuple, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from .common import next_event_id, utc_now
+from .communication import ClientCommand, ServerEvent
+from .server_schemas import ScpMessage, SepMessage, SepPayload
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# --- Lazy, Safe Import for the Optional Accelerator ---
+try:
+    import msgspec
+
+    _MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    _MSGSPEC_AVAILABLE = False
+
+
+if _MSGSPEC_AVAILABLE:
+
+    # The structs are frozen so they can be shared freely between engine stages.
+    # Server-internal emitters may build `SepMessageStruct` directly and skip the
+    # Pydantic models entirely.
+
+    class ScpMessageStruct(msgspec.Struct, frozen=True):
+        """Wire shadow of `ScpMessage`. Field names match the JSON contract."""
+
+        trace_id: str = msgspec.field(name="command_id")
+        type: str
+        payload: Dict[str, Any]
+
+    class SduiPayloadStruct(msgspec.Struct, frozen=True):
+        """
+        Wire shadow of `SduiPayload`, for emitters that place it in `fields`.
+
+        Renderers that already hold the `props` as encoded JSON (a large table
+        serialized straight from a DataFrame, for example) pass a `msgspec.Raw`
+        so the bytes are spliced into the event without being parsed into a
+        dict and re-encoded.
+        """
+
+        ui_component: str
+        props: Union[Dict[str, Any], msgspec.Raw] = msgspec.field(default_factory=dict)
+
+    class SepPayloadStruct(msgspec.Struct, frozen=True):
+        """Wire shadow of `SepPayload`."""
+
+        level: Literal["debug", "info", "warn", "error"]
+        message: str
+        # Emitters that already hold the `fields` as encoded JSON can pass a
+        # `msgspec.Raw`; its bytes are spliced into the output verbatim.
+        fields: Union[Dict[str, Any], msgspec.Raw, None] = None
+        labels: Dict[str, str] = msgspec.field(default_factory=dict)
+
+    class SepMessageStruct(msgspec.Struct, frozen=True):
+        """Wire shadow of `SepMessage`. Field names match the JSON contract."""
+
+        trace_id: str = msgspec.field(name="command_id")
+        event_id: str = msgspec.field(name="id")
+        type: str
+        source: str
+        timestamp: datetime
+        payload: SepPayloadStruct
+
+    class _ScpEnvelopeStruct(msgspec.Struct, frozen=True):
+        """An SCP command whose `payload` is kept as an undecoded JSON slice."""
+
+        trace_id: str = msgspec.field(name="command_id")
+        type: str
+        payload: msgspec.Raw
+
+    # --- Shadows of the `communication` models (no aliases on the wire) ---
+
+    class ClientCommandStruct(msgspec.Struct, frozen=True):
+        """Wire shadow of `ClientCommand`."""
+
+        trace_id: uuid.UUID
+        type: str
+        payload: Dict[str, Any]
+
+    class ServerEventPayloadStruct(msgspec.Struct, frozen=True):
+        """Wire shadow of `ServerEventPayload`."""
+
+        level: Literal["debug", "info", "warn", "error"]
+        message: str
+        fields: Union[Dict[str, Any], msgspec.Raw, None] = None
+
+    class ServerEventStruct(msgspec.Struct, frozen=True, kw_only=True):
+        """Wire shadow of `ServerEvent`, with the same defaults."""
+
+        trace_id: uuid.UUID
+        id: uuid.UUID = msgspec.field(default_factory=next_event_id)
+        type: str
+        source: str = "/cx-server"
+        timestamp: datetime = msgspec.field(default_factory=utc_now)
+        payload: ServerEventPayloadStruct
+
+    class BlockOutputStruct(msgspec.Struct, frozen=True):
+        """Wire shadow of `communication.BlockOutput`."""
+
+        inline_data: Union[Dict[str, Any], msgspec.Raw, None] = None
+        data_ref: Optional[Dict[str, Any]] = None
+
+    class BlockOutputFieldsStruct(msgspec.Struct, frozen=True, kw_only=True):
+        """
+        Wire shadow of `communication.BlockOutputFields`, for use as the
+        `fields` of a `ServerEventStruct`.
+        """
+
+        block_id: str
+        status: Literal["success"] = "success"
+        duration_ms: int
+        inline_output: Optional[BlockOutputStruct] = None
+        targeted_outputs: Optional[Dict[str, BlockOutputStruct]] = None
+        context_updates: Optional[Dict[str, Any]] = None
+
+    class _ClientCommandEnvelopeStruct(msgspec.Struct, frozen=True):
+        """A `ClientCommand` whose `payload` is kept as an undecoded JSON slice."""
+
+        trace_id: uuid.UUID
+        type: str
+        payload: msgspec.Raw
+
+    def _enc_hook(obj: Any) -> Any:
+        """
+        Lets Pydantic models nested inside open `fields` dicts be encoded. The
+        model serializes itself to JSON in one pass, and the bytes are spliced in
+        as-is rather than dumped to a dict for msgspec to walk again.
+        """
+        if isinstance(obj, BaseModel):
+            return msgspec.Raw(obj.__pydantic_serializer__.to_json(obj, by_alias=True))
+        raise NotImplementedError(f"Objects of type {type(obj)} are not supported.")
+
+    # Encoders and decoders are built once and reused for every message.
+    _SCP_DECODER = msgspec.json.Decoder(ScpMessageStruct)
+    _SCP_ENVELOPE_DECODER = msgspec.json.Decoder(_ScpEnvelopeStruct)
+    _SEP_DECODER = msgspec.json.Decoder(SepMessageStruct)
+    _CLIENT_COMMAND_DECODER = msgspec.json.Decoder(ClientCommandStruct)
+    _CLIENT_COMMAND_ENVELOPE_DECODER = msgspec.json.Decoder(
+        _ClientCommandEnvelopeStruct
+    )
+    _PAYLOAD_DECODER = msgspec.json.Decoder(Dict[str, Any])
+    _ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+class CommandEnvelope(NamedTuple):
+    """A command whose `payload` is kept as raw JSON bytes."""
+
+    trace_id: Union[str, uuid.UUID]
+    type: str
+    payload: bytes
+
+    def load_payload(self) -> Dict[str, Any]:
+        """Parses the payload on demand, for consumers that do need to read it."""
+        if not _MSGSPEC_AVAILABLE:
+            return json.loads(self.payload)
+        return _PAYLOAD_DECODER.decode(self.payload)
+
+    def validate_payload(self, model: Type[_ModelT]) -> _ModelT:
+        """
+        Validates the raw payload straight into its payload model (e.g.
+        `PageSavePayload`) in a single pass over the JSON bytes, without building
+        an intermediate dict first.
+        """
+        return model.model_validate_json(self.payload)
+
+
+def decode_command(data: bytes) -> ScpMessage:
+    """
+    Decodes and validates an inbound SCP command from raw WebSocket bytes.
+
+    Raises:
+        pydantic.ValidationError: If the message is malformed, whether or not
+            msgspec is installed.
+    """
+    if not _MSGSPEC_AVAILABLE:
+        return ScpMessage.model_validate_json(data)
+
+    try:
+        command = _SCP_DECODER.decode(data)
+    except msgspec.DecodeError:
+        # The struct only knows the wire name `command_id`; the model also
+        # accepts `trace_id`, so such messages take the Pydantic path. So do
+        # malformed ones, which then fail with the same error as without msgspec.
+        return ScpMessage.model_validate_json(data)
+    # The struct has already been validated, so the Pydantic model is built
+    # without a second validation pass.
+    return ScpMessage.model_construct(**msgspec.structs.asdict(command))
+
+
+def decode_event(data: bytes) -> SepMessage:
+    """
+    Decodes an SEP event from raw bytes, e.g. when replaying a recorded session
+    or in a Python client.
+
+    The structs only know the wire names (`command_id`, `id`), so each field is
+    looked up once instead of under both its alias and its Python name as the
+    `populate_by_name` models must. The models are then filled by Python name.
+    Events that use the Python names (`trace_id`, `event_id`) fall back to the
+    Pydantic path, so both decode the same with or without msgspec.
+
+    Raises:
+        pydantic.ValidationError: If the message is malformed, whether or not
+            msgspec is installed.
+    """
+    if not _MSGSPEC_AVAILABLE:
+        return SepMessage.model_validate_json(data)
+
+    try:
+        event = _SEP_DECODER.decode(data)
+    except msgspec.DecodeError:
+        return SepMessage.model_validate_json(data)
+    values = msgspec.structs.asdict(event)
+    values["payload"] = SepPayload.model_construct(
+        **msgspec.structs.asdict(event.payload)
+    )
+    return SepMessage.model_construct(**values)
+
+
+def decode_command_envelope(data: bytes) -> CommandEnvelope:
+    """
+    Decodes only the envelope of an inbound SCP command, leaving the `payload`
+    as raw JSON bytes.
+
+    Pass-through routers that forward a command without inspecting its payload
+    use this to skip parsing it into Python objects and re-encoding it. Consumers
+    that need the payload should call `decode_command` instead.
+
+    Raises:
+        pydantic.ValidationError: If the message is malformed, whether or not
+            msgspec is installed.
+    """
+    if not _MSGSPEC_AVAILABLE:
+        command = ScpMessage.model_validate_json(data)
+        payload = to_json(command.payload)
+        return CommandEnvelope(command.trace_id, command.type, payload)
+
+    try:
+        envelope = _SCP_ENVELOPE_DECODER.decode(data)
+    except msgspec.DecodeError:
+        command = ScpMessage.model_validate_json(data)
+        return CommandEnvelope(command.trace_id, command.type, to_json(command.payload))
+    return CommandEnvelope(envelope.trace_id, envelope.type, bytes(envelope.payload))
+
+
+def encode_event(message: Union[SepMessage, "SepMessageStruct"]) -> bytes:
+    """
+    Serializes an outbound SEP event to the JSON bytes sent over the WebSocket.
+
+    Accepts either the Pydantic `SepMessage` or, when msgspec is installed, a
+    `SepMessageStruct` built directly by server-internal code.
+
+    The bytes for a `SepMessage` are cached on the instance, so fanning one event
+    out to N connected clients serializes it exactly once. Messages must not be
+    mutated after they have been encoded.
+    """
+    if not isinstance(message, SepMessage):
+        return _ENCODER.encode(message)
+
+    if message._cached_json is None:
+        message._cached_json = _encode_sep_message(message)
+    return message._cached_json
+
+
+def _encode_sep_message(message: SepMessage) -> bytes:
+    """Serializes a Pydantic `SepMessage`, using msgspec when it is available."""
+    if not _MSGSPEC_AVAILABLE:
+        return message.__pydantic_serializer__.to_json(message, by_alias=True)
+
+    payload = message.payload
+    return _ENCODER.encode(
+        SepMessageStruct(
+            trace_id=message.trace_id,
+            event_id=message.event_id,
+            type=message.type,
+            source=message.source,
+            timestamp=message.timestamp,
+            payload=SepPayloadStruct(
+                level=payload.level,
+                message=payload.message,
+                fields=payload.fields,
+                labels=payload.labels,
+            ),
+        )
+    )
+
+
+# --- `communication` Protocol Models ---
+
+
+def decode_client_command(data: bytes) -> ClientCommand:
+    """
+    Decodes and validates an inbound `ClientCommand` from raw WebSocket bytes.
+
+    Always returns the Pydantic model. Server-internal handlers that only read
+    `trace_id`, `type` and `payload` can use `decode_client_command_struct`
+    instead to skip building it.
+
+    Raises:
+        pydantic.ValidationError: If the message is malformed.
+    """
+    return ClientCommand.model_validate_json(data)
+
+
+def decode_client_command_struct(data: bytes) -> "ClientCommandStruct":
+    """
+    Decodes an inbound `ClientCommand` straight into its `ClientCommandStruct`
+    shadow, without building the Pydantic model.
+
+    Raises:
+        RuntimeError: If msgspec is not installed.
+        msgspec.ValidationError: If the message is malformed.
+    """
+    if not _MSGSPEC_AVAILABLE:
+        raise RuntimeError(
+            "decode_client_command_struct requires msgspec (cx-kit[fast]); "
+            "use decode_client_command instead."
+        )
+    return _CLIENT_COMMAND_DECODER.decode(data)
+
+
+def encode_server_event(event: Union[ServerEvent, "ServerEventStruct"]) -> bytes:
+    """
+    Serializes an outbound `ServerEvent` (or `ServerEventStruct`) to JSON bytes.
+
+    Pydantic events are copied field-by-field into the struct shadows and encoded
+    by the shared msgspec encoder; their nested `fields` models go through the
+    encoder's Pydantic hook.
+    """
+    if not _MSGSPEC_AVAILABLE:
+        return event.__pydantic_serializer__.to_json(event)
+    if isinstance(event, ServerEvent):
+        payload = event.payload
+        event = ServerEventStruct(
+            trace_id=event.trace_id,
+            id=event.id,
+            type=event.type,
+            source=event.source,
+            timestamp=event.timestamp,
+            payload=ServerEventPayloadStruct(
+                level=payload.level, message=payload.message, fields=payload.fields
+            ),
+        )
+    return _ENCODER.encode(event)
+
+
+def decode_client_command_envelope(data: bytes) -> CommandEnvelope:
+    """
+    Decodes only the envelope of an inbound `ClientCommand`, leaving the
+    `payload` as raw JSON bytes until `CommandEnvelope.load_payload()` is called.
+
+    The `communication` counterpart of `decode_command_envelope`.
+
+    Raises:
+        pydantic.ValidationError: If the message is malformed, whether or not
+            msgspec is installed.
+    """
+    if not _MSGSPEC_AVAILABLE:
+        command = ClientCommand.model_validate_json(data)
+        payload = to_json(command.payload)
+        return CommandEnvelope(command.trace_id, command.type, payload)
+
+    try:
+        envelope = _CLIENT_COMMAND_ENVELOPE_DECODER.decode(data)
+    except msgspec.DecodeError:
+        # Malformed messages fail with the same error as without msgspec.
+        command = ClientCommand.model_validate_json(data)
+        return CommandEnvelope(command.trace_id, command.type, to_json(command.payload))
+    return CommandEnvelope(envelope.trace_id, envelope.type, bytes(envelope.payload))
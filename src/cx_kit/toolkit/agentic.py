@@ -8,6 +8,7 @@ agentic processes. It includes the `ToolRegistry` for discovering capabilities
 and the `AgentOrchestrator` for executing pluggable reasoning flows.
 """
 
+import threading
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import structlog
@@ -30,29 +31,54 @@ class ToolRegistry:
         """
         Args:
             capability_loader: An instance of the orchestrator's CapabilityLoader.
+                If it also provides `list_functions_lightweight()`, returning
+                `(function_name, capability_key)` pairs read from the plugin
+                manifests without importing anything, resolving a single tool
+                only loads the capability that provides it.
         """
         self._loader = capability_loader
         self._tool_schemas: Optional[List["FunctionSignature"]] = None
         self._tool_map: Optional[Dict[str, "BaseCapability"]] = None
+        # Loaded capabilities by key, shared by full discovery and per-tool
+        # lookups so that no plugin is ever loaded twice.
+        self._capabilities: Dict[str, "BaseCapability"] = {}
+        self._function_keys: Optional[Dict[str, str]] = None
+        self._lock = threading.RLock()
+
+    def _load_capability(self, key: str) -> "BaseCapability":
+        with self._lock:
+            capability = self._capabilities.get(key)
+            if capability is None:
+                capability = self._loader.load_strategy(key)
+                self._capabilities[key] = capability
+            return capability
 
     def get_all_schemas(self) -> List["FunctionSignature"]:
         """
         Discovers all capabilities and aggregates their function signatures.
         This is the list of tools that gets passed to an agent.
         """
-        if self._tool_schemas is None:
-            self._tool_schemas = []
-            self._tool_map = {}
+        if self._tool_schemas is not None:
+            return self._tool_schemas
+
+        with self._lock:
+            if self._tool_schemas is not None:
+                return self._tool_schemas
+            tool_schemas: List["FunctionSignature"] = []
+            tool_map: Dict[str, "BaseCapability"] = {}
             # The capability_loader is provided by the cx-shell orchestrator
             all_capabilities = self._loader.discover_plugins()
             for key, entry_point in all_capabilities.items():
                 try:
-                    capability_instance = self._loader.load_strategy(key)
+                    capability_instance = self._load_capability(key)
                     functions = capability_instance.get_functions()
                     for func_sig in functions:
                         # Store which capability provides which function
-                        self._tool_map[func_sig.name] = capability_instance
-                    self._tool_schemas.extend(functions)
+                        tool_map[func_sig.name] = capability_instance
+                        # Generate the cached JSON Schema up front, so the first
+                        # agent request doesn't pay for it.
+                        func_sig.parameters_json_schema
+                    tool_schemas.extend(functions)
                 except Exception as e:
                     logger.warning(
                         "Failed to load functions from capability.",
@@ -60,13 +86,24 @@ class ToolRegistry:
                         error=str(e),
                     )
 
-            logger.info("Tool discovery complete.", tool_count=len(self._tool_schemas))
+            self._tool_map = tool_map
+            self._tool_schemas = tool_schemas
+            logger.info("Tool discovery complete.", tool_count=len(tool_schemas))
 
         return self._tool_schemas
 
     def get_capability_for_function(self, function_name: str) -> "BaseCapability":
         """Finds the capability instance responsible for executing a given function."""
         if self._tool_map is None:
+            function_keys = self._get_function_keys()
+            if function_keys is not None:
+                # Load only the plugin that provides this tool.
+                key = function_keys.get(function_name)
+                if key is None:
+                    raise NameError(
+                        f"No installed capability provides a function named '{function_name}'."
+                    )
+                return self._load_capability(key)
             self.get_all_schemas()  # Ensure discovery has run
 
         capability = self._tool_map.get(function_name)
@@ -76,6 +113,18 @@ class ToolRegistry:
             )
         return capability
 
+    def _get_function_keys(self) -> Optional[Dict[str, str]]:
+        """
+        The function-name to capability-key index from the loader's manifest scan,
+        or `None` if the loader does not offer one.
+        """
+        if self._function_keys is None:
+            list_functions = getattr(self._loader, "list_functions_lightweight", None)
+            if list_functions is None:
+                return None
+            self._function_keys = dict(list_functions())
+        return self._function_keys
+
 
 class AgentOrchestrator:
     """
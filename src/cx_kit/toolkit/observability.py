@@ -1,11 +1,34 @@
 # cx-kit/src/cx_kit/toolkit/observability.py
 
-import structlog
+"""
+Provides the logging helpers for the cx-kit SDK.
+
+The platform bootstrap is expected to call
+`structlog.configure(..., cache_logger_on_first_use=True)` once at startup. The
+shared base logger below then materializes its processor chain on first use
+instead of rebuilding it for every `get_logger()` call.
+"""
+
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from ..schemas.context import RunContext
 
+# structlog is imported on the first `get_logger()` call rather than with this
+# module, so importing the toolkit does not pay for it until something logs.
+# The base logger is a lazy proxy: it reads the structlog configuration when
+# first bound, so creating it early does not pin the configuration either.
+_base_logger = None
+
+
+def _get_base_logger():
+    global _base_logger
+    if _base_logger is None:
+        import structlog
+
+        _base_logger = structlog.get_logger()
+    return _base_logger
+
 
 def get_logger(context: Optional["RunContext"] = None, **kwargs):
     """
@@ -15,21 +38,16 @@ def get_logger(context: Optional["RunContext"] = None, **kwargs):
     to call even without a RunContext (e.g., during startup or discovery), in
     which case it returns a logger bound only with the provided kwargs.
     """
-    # Start with a base logger instance
-    log = structlog.get_logger()
-
     # Bind context-specific fields ONLY if a valid context is provided.
     if context and hasattr(context, "run_id"):
-        bindings = {"run_id": context.run_id}
-
         # You can add more context bindings here if needed in the future
         # e.g., if hasattr(context, "current_block") and context.current_block:
         #    bindings["block_id"] = context.current_block.id
+        bindings = {"run_id": context.run_id}
+        # Caller-provided kwargs take precedence, as they did with two binds.
+        kwargs = {**bindings, **kwargs}
 
-        log = log.bind(**bindings)
-
-    # Always bind any additional kwargs provided by the caller.
+    # A single bind, so only one bound logger is allocated per call.
     if kwargs:
-        log = log.bind(**kwargs)
-
-    return log
+        return _get_base_logger().bind(**kwargs)
+    return _get_base_logger()
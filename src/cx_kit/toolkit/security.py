@@ -8,7 +8,8 @@ access and validate secrets required for their operations, without needing
 to know the specifics of the underlying secret storage backend.
 """
 
-from typing import Any, Dict, Optional, Type, TYPE_CHECKING
+import asyncio
+from typing import Any, Dict, Iterable, Optional, Type, TYPE_CHECKING
 from pydantic import BaseModel, SecretStr
 
 if TYPE_CHECKING:
@@ -59,11 +60,41 @@ class ConnectionSecrets:
         self._secrets_service: "SecretService" = context.secrets
         self._connection_id = connection_source_id
         self._raw_secrets: Optional[Dict[str, Any]] = None
+        # The run-wide cache, if the context provides one (see `RunContext`).
+        self._run_cache: Optional[Dict[str, asyncio.Future]] = getattr(
+            context, "_secrets_cache", None
+        )
 
     async def _load_if_needed(self):
-        """Loads the secrets from the backend on first access."""
-        if self._raw_secrets is None:
+        """
+        Loads the secrets from the backend on first access.
+
+        Within a run, the backend is asked once per connection: later helpers
+        reuse the result, and concurrent first accesses wait on the same request.
+        A failed request is not cached, so the next access retries it.
+        """
+        if self._raw_secrets is not None:
+            return
+
+        cache = self._run_cache
+        if cache is None:
             self._raw_secrets = await self._secrets_service.get_all(self._connection_id)
+            return
+
+        pending = cache.get(self._connection_id)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._secrets_service.get_all(self._connection_id)
+            )
+            cache[self._connection_id] = pending
+        try:
+            # Shielded so that one cancelled caller does not cancel the request
+            # for the others waiting on it.
+            self._raw_secrets = await asyncio.shield(pending)
+        except Exception:
+            if cache.get(self._connection_id) is pending:
+                del cache[self._connection_id]
+            raise
 
     async def get(self, key: str, default: Any = None) -> Any:
         """Retrieves a single secret value by its key."""
@@ -93,3 +124,24 @@ class ConnectionSecrets:
         """
         await self._load_if_needed()
         return schema.model_validate(self._raw_secrets)
+
+
+async def prefetch_secrets(
+    context: "RunContext", connection_source_ids: Iterable[str]
+) -> None:
+    """
+    Loads the secrets of several connections concurrently, ahead of the steps
+    that need them (e.g. right after the execution plan is resolved). The
+    results land in the run's cache, so each step's first `ConnectionSecrets`
+    access does not wait on the backend.
+
+    Failures are not raised here: they are not cached either, so the step that
+    actually needs the secrets retries the request and surfaces the error.
+    """
+    await asyncio.gather(
+        *(
+            ConnectionSecrets(context, connection_id)._load_if_needed()
+            for connection_id in dict.fromkeys(connection_source_ids)
+        ),
+        return_exceptions=True,
+    )
@@ -7,7 +7,8 @@ including dependency graph construction and caching logic.
 
 import hashlib
 import json
-from typing import Dict, List, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 # Use TYPE_CHECKING to avoid a hard dependency on networkx at runtime,
 # allowing it to be a dependency of the orchestrator (`cx-shell`) instead
@@ -18,6 +19,87 @@ if TYPE_CHECKING:
     from ..schemas.project import Block
 
 
+@dataclass(slots=True)
+class StepIndex:
+    """
+    A flat, structure-of-arrays view over the planner-relevant fields of a list
+    of workflow steps, built once after validation.
+
+    Planner passes (topological ordering, dependency and skip checks) only touch
+    one or two fields per step. Reading them from parallel lists avoids a Pydantic
+    attribute lookup per field per pass; the full step objects are only needed
+    when a step actually runs. Position `i` in every list refers to `steps[i]`.
+
+    Dependencies are also packed into integer bitmasks: bit `j` of `dep_masks[i]`
+    is set when step `i` depends on step `j`, whether explicitly (`depends_on`)
+    or implicitly (an `inputs` reference). Completed steps are tracked the same
+    way, so "are all of this step's dependencies done?" is a single `&`.
+    """
+
+    ids: List[str]
+    depends_on: List[List[str]]
+    inputs: List[List[str]]
+    engines: List[Optional[str]]
+    if_conditions: List[Optional[str]]
+    positions: Dict[str, int] = field(default_factory=dict)
+    dep_masks: List[int] = field(default_factory=list)
+
+    def is_ready(self, i: int, completed_mask: int) -> bool:
+        """Returns True if every dependency of step `i` is in `completed_mask`."""
+        return self.dep_masks[i] & ~completed_mask == 0
+
+    def ready_steps(self, completed_mask: int) -> List[int]:
+        """
+        Returns the positions of the steps that have not completed yet but whose
+        dependencies all have.
+        """
+        return [
+            i
+            for i, mask in enumerate(self.dep_masks)
+            if not completed_mask >> i & 1 and mask & ~completed_mask == 0
+        ]
+
+
+def build_step_index(steps: List["WorkflowStep"]) -> StepIndex:
+    """
+    Builds a `StepIndex` from a list of validated `WorkflowStep` (or legacy
+    `Block`) objects.
+
+    Dependency references follow the same rules as `build_dependency_graph`:
+    `inputs` that name an unknown step (or the step itself) are ignored, and
+    unknown `depends_on` IDs raise.
+
+    Raises:
+        ValueError: If a step has a `depends_on` entry that names no known step.
+    """
+    index = StepIndex(ids=[], depends_on=[], inputs=[], engines=[], if_conditions=[])
+    for i, step in enumerate(steps):
+        index.ids.append(step.id)
+        index.depends_on.append(list(step.depends_on or ()))
+        index.inputs.append(list(step.inputs or ()))
+        index.engines.append(step.engine)
+        index.if_conditions.append(step.if_condition)
+        index.positions[step.id] = i
+
+    # Python ints are arbitrary precision, so the masks work for any step count.
+    positions = index.positions
+    for i, step_id in enumerate(index.ids):
+        mask = 0
+        for dep_id in index.depends_on[i]:
+            if dep_id not in positions:
+                raise ValueError(
+                    f"Step '{step_id}' has an invalid dependency: '{dep_id}'"
+                )
+            mask |= 1 << positions[dep_id]
+        for input_str in index.inputs[i]:
+            if "." in input_str:
+                dep = positions.get(input_str.split(".", 1)[0])
+                if dep is not None and dep != i:
+                    mask |= 1 << dep
+        index.dep_masks.append(mask)
+    return index
+
+
 def build_dependency_graph(steps: List["WorkflowStep"]) -> "DiGraph":
     """
     Builds a directed acyclic graph (DAG) from a list of workflow steps
@@ -32,24 +114,32 @@ def build_dependency_graph(steps: List["WorkflowStep"]) -> "DiGraph":
         steps: A list of `WorkflowStep` objects.
 
     Returns:
-        A `networkx.DiGraph` object representing the workflow.
+        A `networkx.DiGraph` object representing the workflow. Its
+        `graph["topo_order"]` holds the step IDs in `nx.topological_sort` order.
 
     Raises:
         ValueError: If a circular dependency is detected in the workflow.
     """
     import networkx as nx  # Lazy import for this heavy dependency
 
-    dag = nx.DiGraph()
     step_map = {step.id: step for step in steps}
 
+    # Nodes and edges are collected first, then added in bulk. Both dicts keep
+    # the order in which adding them one by one would have inserted them (an
+    # edge inserts its source node), so the graph and its iteration order are
+    # unchanged; repeated edges, e.g. from `step_a.col1` and `step_a.col2`,
+    # are only recorded once.
+    nodes: Dict[str, None] = {}
+    edges: Dict[Tuple[str, str], None] = {}
     for step in steps:
-        dag.add_node(step.id, step_data=step)
+        nodes[step.id] = None
 
         # Add explicit dependencies from the 'depends_on' field
         if step.depends_on:
             for dep_id in step.depends_on:
                 if dep_id in step_map:
-                    dag.add_edge(dep_id, step.id)
+                    nodes.setdefault(dep_id)
+                    edges[(dep_id, step.id)] = None
                 else:
                     raise ValueError(
                         f"Step '{step.id}' has an invalid dependency: '{dep_id}'"
@@ -58,12 +148,21 @@ def build_dependency_graph(steps: List["WorkflowStep"]) -> "DiGraph":
         # Add implicit dependencies from the 'inputs' field (e.g., "step_a.output")
         if step.inputs:
             for input_str in step.inputs:
-                if "." in input_str:
-                    dep_id = input_str.split(".", 1)[0]
-                    if dep_id in step_map and dep_id != step.id:
-                        dag.add_edge(dep_id, step.id)
+                dep_id, sep, _ = input_str.partition(".")
+                if sep and dep_id in step_map and dep_id != step.id:
+                    nodes.setdefault(dep_id)
+                    edges[(dep_id, step.id)] = None
 
-    if not nx.is_directed_acyclic_graph(dag):
+    dag = nx.DiGraph()
+    dag.add_nodes_from((node, {"step_data": step_map[node]}) for node in nodes)
+    dag.add_edges_from(edges)
+
+    # Sorting is the acyclicity check (it is what `is_directed_acyclic_graph`
+    # runs internally), so the order it yields is kept for the caller rather
+    # than recomputed by it.
+    try:
+        dag.graph["topo_order"] = list(nx.topological_sort(dag))
+    except nx.NetworkXUnfeasible:
         try:
             cycle = nx.find_cycle(dag, orientation="original")
             raise ValueError(f"Workflow contains a circular dependency: {cycle}")
@@ -74,6 +173,13 @@ def build_dependency_graph(steps: List["WorkflowStep"]) -> "DiGraph":
     return dag
 
 
+# The fields that constitute a block's semantic identity. `if_condition` was
+# meant to be among them, but the key used to be built from a by-alias dump in
+# which it appears as `if`, so it never took part; it stays out to keep existing
+# cache keys valid.
+_SEMANTIC_FIELDS = ("engine", "connection", "run", "content", "inputs", "outputs")
+
+
 def calculate_cache_key(
     rendered_block: "Block", capability_version: str, parent_hashes: Dict[str, str]
 ) -> str:
@@ -82,34 +188,26 @@ def calculate_cache_key(
     block based on its fully rendered semantic content, the version of the
     capability that will execute it, and the content hashes of its parents.
     """
-    hasher = hashlib.sha256()
-
-    # 1. Define the complete set of fields that constitute the semantic identity.
-    semantic_fields = {
-        "engine",
-        "connection",
-        "run",
-        "content",
-        "inputs",
-        "outputs",
-        "if_condition",
-    }
-
-    # 2. Create a dictionary with only these fields from the *rendered* block.
-    block_dict = rendered_block.model_dump(by_alias=True)
-    semantic_dict = {
-        k: block_dict.get(k) for k in semantic_fields if block_dict.get(k) is not None
-    }
-
-    # 3. Serialize and hash this semantic dictionary.
-    semantic_str = json.dumps(semantic_dict, sort_keys=True)
-    hasher.update(semantic_str.encode("utf-8"))
-
-    # 4. CRITICAL: Include the capability's version in the hash.
-    hasher.update(capability_version.encode("utf-8"))
-
-    # 5. Include parent hashes to ensure full data lineage affects the key.
+    # 1. Collect the semantic fields straight from the *rendered* block. They
+    # hold plain JSON data, so this matches what a `model_dump()` would give
+    # without dumping every other field as well.
+    semantic_dict = {}
+    for name in _SEMANTIC_FIELDS:
+        value = getattr(rendered_block, name)
+        if value is not None:
+            semantic_dict[name] = value
+
+    # 2. Serialize this semantic dictionary.
+    parts = [json.dumps(semantic_dict, sort_keys=True)]
+
+    # 3. CRITICAL: Include the capability's version in the hash.
+    parts.append(capability_version)
+
+    # 4. Include parent hashes to ensure full data lineage affects the key.
     for block_id, hash_val in sorted(parent_hashes.items()):
-        hasher.update(f"{block_id}:{hash_val or ''}".encode("utf-8"))
+        parts.append(f"{block_id}:{hash_val or ''}")
 
-    return f"sha256:{hasher.hexdigest()}"
+    # Hash everything in one call: the digest is the same as feeding the parts
+    # one `update()` at a time, without a call into the hasher per part.
+    digest = hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
+    return f"sha256:{digest}"
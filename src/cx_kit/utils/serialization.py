@@ -8,31 +8,75 @@ from various data science libraries (Pandas, NumPy) and standard libraries
 into a format that is 100% compatible with JSON.
 """
 
-from datetime import date, datetime, timezone
+import sys
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
-from pydantic import BaseModel
 
-# --- Lazy, Safe Imports for Optional Heavy Dependencies ---
-# We use a try/except block to avoid a hard dependency on numpy and pandas.
-# The serialization logic will only apply if these libraries are installed
-# in the environment where this function is called.
-try:
-    import numpy as np
+# --- Lazy Handles for Heavy Dependencies ---
+# numpy, pandas and pydantic are never imported by this module: importing pandas
+# alone costs hundreds of milliseconds at startup, pydantic tens. A value can
+# only be a NumPy, Pandas or Pydantic type if its library is already loaded, so
+# the handles are picked up from `sys.modules` on first sight and cached in
+# these module globals.
+_np = None
+_pd = None
+_pyd = None
 
-    _NUMPY_AVAILABLE = True
-except ImportError:
-    np = None
-    _NUMPY_AVAILABLE = False
 
-try:
-    import pandas as pd
+def _numpy():
+    global _np
+    if _np is None:
+        _np = sys.modules.get("numpy")
+    return _np
 
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    pd = None
-    _PANDAS_AVAILABLE = False
+
+def _pandas():
+    global _pd
+    if _pd is None:
+        _pd = sys.modules.get("pandas")
+    return _pd
+
+
+def _pydantic():
+    global _pyd
+    if _pyd is None:
+        _pyd = sys.modules.get("pydantic")
+    return _pyd
+
+
+def _serialize_datetime(data: datetime) -> str:
+    # Naive datetimes are assumed to be UTC; appending the 'Z' directly avoids
+    # building an aware copy first.
+    if data.tzinfo is None:
+        return data.isoformat() + "Z"
+    # Use the standard ISO 8601 format with 'Z' for UTC.
+    text = data.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _serialize_bytes(data: bytes) -> str:
+    # Attempt to decode as UTF-8, with a fallback for non-text data.
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return f"<binary data of size {len(data)} bytes>"
+
+
+# Values of exactly these types are already JSON-compatible.
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Converters looked up by exact type. Most values in a payload hit either this
+# table or `_JSON_SCALAR_TYPES`, skipping the `isinstance` checks below, which
+# remain for subclasses (e.g. `pd.Timestamp`, `np.float64`, enums).
+_EXACT_TYPE_HANDLERS = {
+    datetime: _serialize_datetime,
+    date: date.isoformat,
+    UUID: str,
+    Decimal: float,
+    bytes: _serialize_bytes,
+}
 
 
 def safe_serialize(data: Any) -> Any:
@@ -50,42 +94,83 @@ def safe_serialize(data: Any) -> Any:
         A new data structure containing only JSON-compatible types
         (lists, dicts, strings, numbers, booleans, None).
     """
+    data_type = type(data)
+    if data_type in _JSON_SCALAR_TYPES:
+        return data
+    # Plain containers are the next most common; subclasses are handled below.
+    if data_type is dict:
+        return {
+            (key if type(key) is str else str(key)): safe_serialize(value)
+            for key, value in data.items()
+        }
+    if data_type is list:
+        return [safe_serialize(item) for item in data]
+    handler = _EXACT_TYPE_HANDLERS.get(data_type)
+    if handler is not None:
+        return handler(data)
 
     # --- Structural Types (Recursive) ---
     if isinstance(data, list):
         return [safe_serialize(item) for item in data]
 
     if isinstance(data, dict):
-        return {str(key): safe_serialize(value) for key, value in data.items()}
+        return {
+            (key if type(key) is str else str(key)): safe_serialize(value)
+            for key, value in data.items()
+        }
 
     # --- Pydantic Models ---
-    if isinstance(data, BaseModel):
+    pydantic = _pydantic()
+    if pydantic is not None and isinstance(data, pydantic.BaseModel):
         # Recursively serialize the model's dictionary representation.
         return safe_serialize(data.model_dump())
 
-    # --- Datetime and Timedelta Types ---
-    if _PANDAS_AVAILABLE and isinstance(data, pd.Timestamp):
-        # Convert Pandas Timestamp to a standard Python datetime object.
-        data = data.to_pydatetime()
-
+    # --- Pandas Containers (if available) ---
+    pd = _pandas()
+    if pd is not None:
+        if isinstance(data, pd.DataFrame):
+            # One row dict per record, built by Pandas; cells may still hold
+            # NumPy scalars or Timestamps, so the result is walked once.
+            return safe_serialize(data.to_dict(orient="records"))
+        if isinstance(data, pd.Series):
+            return safe_serialize(data.tolist())
+        # `pd.NaT` subclasses `datetime` but has no date to format.
+        if data is pd.NaT:
+            return "NaT"
+        # Formatted like `to_pydatetime()`, which has no room for nanoseconds.
+        if isinstance(data, pd.Timestamp) and data.nanosecond:
+            data = data.replace(nanosecond=0)
+
+    # --- Datetime Types ---
+    # `pd.Timestamp` subclasses `datetime` and is formatted the same way.
     if isinstance(data, datetime):
-        # Ensure timezone-awareness for consistency (assume UTC if naive).
-        if data.tzinfo is None:
-            data = data.replace(tzinfo=timezone.utc)
-        # Use the standard ISO 8601 format with 'Z' for UTC.
-        return data.isoformat().replace("+00:00", "Z")
+        return _serialize_datetime(data)
 
     if isinstance(data, date):
         return data.isoformat()
 
     # --- NumPy Specific Types (if available) ---
-    if _NUMPY_AVAILABLE:
+    np = _numpy()
+    if np is not None:
+        # `datetime64` values at nanosecond precision convert to plain ints,
+        # so they are brought to microseconds (`datetime`, or None for NaT)
+        # and formatted like any other datetime.
+        if isinstance(data, np.datetime64):
+            return safe_serialize(data.astype("datetime64[us]").item())
         # For scalar types like np.int64, np.float64, np.bool_
         if isinstance(data, np.generic):
             return data.item()
         # For NumPy arrays
         if isinstance(data, np.ndarray):
-            return data.tolist()
+            # Bool, integer and float arrays convert to plain Python scalars in C
+            # and need no further walk. Other dtypes (object, datetime64, ...)
+            # can yield values that still need converting.
+            kind = data.dtype.kind
+            if kind in "biuf":
+                return data.tolist()
+            if kind == "M":
+                data = data.astype("datetime64[us]")
+            return safe_serialize(data.tolist())
 
     # --- Other Standard Library Types ---
     if isinstance(data, UUID):
@@ -96,11 +181,7 @@ def safe_serialize(data: Any) -> Any:
 
     # --- Special Case for `bytes` ---
     if isinstance(data, bytes):
-        # Attempt to decode as UTF-8, with a fallback for non-text data.
-        try:
-            return data.decode("utf-8")
-        except UnicodeDecodeError:
-            return f"<binary data of size {len(data)} bytes>"
+        return _serialize_bytes(data)
 
     # For all other types, return as is. The `json.dumps` default handler
     # will raise a TypeError if it's not a known JSON type.
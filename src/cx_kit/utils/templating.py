@@ -4,10 +4,17 @@
 Provides low-level, pure-Python utilities for Jinja2 templating.
 """
 
+import functools
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from jinja2 import Environment, TemplateError
+from .serialization import safe_serialize
+
+# jinja2 is imported where it is used: it is only needed once an environment is
+# created or a template is rendered, so importing this module alone stays cheap.
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+    from jinja2.environment import TemplateExpression
 
 
 def sql_quote_filter(value: Any) -> str:
@@ -18,11 +25,13 @@ def sql_quote_filter(value: Any) -> str:
     return f"'{str(value).replace("'", "''")}'"
 
 
-def create_jinja_environment() -> Environment:
+def create_jinja_environment() -> "Environment":
     """
     Creates and configures a standard Jinja2 environment with custom filters
     and globals for use by the WorkflowEngine and other components.
     """
+    from jinja2 import Environment
+
     # autoescape=False is generally safer for a system that generates code
     # and structured data, as we want to control escaping explicitly.
     jinja_env = Environment(autoescape=False)
@@ -41,7 +50,67 @@ def create_jinja_environment() -> Environment:
     return jinja_env
 
 
-def recursive_render(data: Any, context: Dict, jinja_env: Environment) -> Any:
+@functools.lru_cache(maxsize=1)
+def _default_jinja_environment() -> "Environment":
+    """
+    The standard environment `recursive_render` uses when none is passed,
+    created once per process. Callers that customize their environment (extra
+    filters or globals) should create their own with `create_jinja_environment`.
+    """
+    return create_jinja_environment()
+
+
+def _environment_cache(jinja_env: "Environment", method: str) -> Any:
+    """
+    Returns an LRU-memoized version of `jinja_env.<method>`, stored on the
+    environment itself. Each environment keeps its own cache and releases it
+    with the environment, rather than a module-level cache holding every
+    environment it has seen alive.
+    """
+    attribute = f"_cx_cached_{method}"
+    cached = jinja_env.__dict__.get(attribute)
+    # `Environment.overlay()` copies its parent's attributes, this cache included.
+    if cached is None or cached.__wrapped__.__self__ is not jinja_env:
+        cached = functools.lru_cache(maxsize=1024)(getattr(jinja_env, method))
+        setattr(jinja_env, attribute, cached)
+    return cached
+
+
+def compile_expression(
+    expression: str, jinja_env: "Environment"
+) -> "TemplateExpression":
+    """
+    Compiles a bare Jinja2 expression (e.g. a step's `if` condition) into a
+    callable, memoized per environment. Parsing dominates the cost of evaluating
+    such expressions, and the same few expressions are evaluated on every run,
+    so each one is parsed once and the result is called with the run's context.
+    """
+    return _environment_cache(jinja_env, "compile_expression")(expression)
+
+
+def _compile_template(source: str, jinja_env: "Environment") -> "Template":
+    """`jinja_env.from_string`, memoized like `compile_expression`."""
+    return _environment_cache(jinja_env, "from_string")(source)
+
+
+def _bare_expression(data: str) -> Optional[str]:
+    """
+    Returns the expression inside `data` if the string is a single `{{ ... }}`
+    block and nothing else (surrounding whitespace aside), otherwise None.
+    """
+    stripped_data = data.strip()
+    if (
+        stripped_data.startswith("{{")
+        and stripped_data.endswith("}}")
+        and stripped_data.count("{{") == 1
+    ):
+        return stripped_data[2:-2].strip()
+    return None
+
+
+def recursive_render(
+    data: Any, context: Dict, jinja_env: Optional["Environment"] = None
+) -> Any:
     """
     Recursively traverses a data structure (dicts, lists) and renders any
     string values that contain Jinja2 template expressions.
@@ -53,7 +122,8 @@ def recursive_render(data: Any, context: Dict, jinja_env: Environment) -> Any:
     Args:
         data: The data structure to render (e.g., a parsed YAML block).
         context: The dictionary of values available to the templates.
-        jinja_env: The configured Jinja2 Environment instance to use.
+        jinja_env: The configured Jinja2 Environment instance to use. Defaults
+            to a shared standard environment, created on first use.
 
     Returns:
         A new data structure with all template expressions rendered.
@@ -64,33 +134,97 @@ def recursive_render(data: Any, context: Dict, jinja_env: Environment) -> Any:
         return [recursive_render(i, context, jinja_env) for i in data]
 
     if isinstance(data, str):
-        stripped_data = data.strip()
+        # Most strings in a block spec are literal; skip the checks below.
+        if "{{" not in data:
+            return data
+        if jinja_env is None:
+            jinja_env = _default_jinja_environment()
 
         # Heuristic: If the string is ONLY a Jinja expression block, evaluate it
         # directly to preserve its native Python type (e.g., a list, int, dict).
-        if (
-            stripped_data.startswith("{{")
-            and stripped_data.endswith("}}")
-            and stripped_data.count("{{") == 1
-        ):
-            expression = stripped_data[2:-2].strip()
+        expression = _bare_expression(data)
+        if expression is not None:
             try:
                 # Use compile_expression for direct evaluation to a Python object.
-                return jinja_env.compile_expression(expression)(**context)
+                return compile_expression(expression, jinja_env)(**context)
             except Exception:
                 # Fallback to standard string rendering on any evaluation error.
                 pass
 
         # For standard interpolation (e.g., "Hello {{ name }}") or fallbacks,
         # render as a string.
-        if "{{" in data:
-            try:
-                template = jinja_env.from_string(data)
-                return template.render(context)
-            except TemplateError as e:
-                raise ValueError(
-                    f"Jinja rendering failed for template '{data}': {e}"
-                ) from e
+        from jinja2 import TemplateError
+
+        try:
+            template = _compile_template(data, jinja_env)
+            return template.render(context)
+        except TemplateError as e:
+            raise ValueError(
+                f"Jinja rendering failed for template '{data}': {e}"
+            ) from e
 
     # For all other types (int, bool, etc.), return the value as is.
     return data
+
+
+def render_and_serialize(
+    data: Any, context: Dict, jinja_env: Optional["Environment"] = None
+) -> Any:
+    """
+    Equivalent to `safe_serialize(recursive_render(data, context, jinja_env))`,
+    in a single traversal: templates are rendered and the result converted to
+    JSON-compatible types as each value is visited, instead of building the
+    rendered structure and then walking it again.
+
+    Raises:
+        ValueError: If a template fails to render (see `recursive_render`).
+    """
+    if isinstance(data, dict):
+        return {
+            (k if type(k) is str else str(k)): render_and_serialize(
+                v, context, jinja_env
+            )
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [render_and_serialize(i, context, jinja_env) for i in data]
+    if isinstance(data, str) and "{{" in data:
+        # A bare expression can evaluate to any object, e.g. a datetime.
+        return safe_serialize(recursive_render(data, context, jinja_env))
+    return safe_serialize(data)
+
+
+def precompile(data: Any, jinja_env: Optional["Environment"] = None) -> None:
+    """
+    Compiles every template in a data structure ahead of time, into the same
+    caches `recursive_render` reads, without rendering anything.
+
+    Meant for run startup (e.g. right after the execution plan is resolved), so
+    the first render of each block does not pay for parsing. Pass the same
+    `jinja_env` that will be given to `recursive_render`. Templates with syntax
+    errors are skipped here; `recursive_render` reports them when used.
+    """
+    if isinstance(data, dict):
+        for value in data.values():
+            precompile(value, jinja_env)
+        return
+    if isinstance(data, list):
+        for item in data:
+            precompile(item, jinja_env)
+        return
+    if not isinstance(data, str) or "{{" not in data:
+        return
+
+    if jinja_env is None:
+        jinja_env = _default_jinja_environment()
+
+    from jinja2 import TemplateError
+
+    expression = _bare_expression(data)
+    try:
+        if expression is not None:
+            compile_expression(expression, jinja_env)
+        else:
+            _compile_template(data, jinja_env)
+    except TemplateError:
+        pass
@@ -0,0 +1,80 @@
+import pytest
+from pydantic import BaseModel
+
+from cx_kit.schemas.agent import (
+    Beliefs,
+    FunctionSignature,
+    Message,
+    Observation,
+    ToolCall,
+)
+
+
+def _entries():
+    return [
+        Message(role="user", content="hi"),
+        ToolCall(function_name="f", parameters={"a": 1}),
+        Observation(tool_name="f", tool_input={"a": 1}, output=[1], status="success"),
+        Message(role="assistant", content="done"),
+    ]
+
+
+def test_history_append_and_record_keep_order():
+    beliefs = Beliefs(initial_goal="g")
+    first, call, observation, last = _entries()
+
+    beliefs.history.append(first)
+    beliefs.record(call)
+    beliefs.history.extend([observation, last])
+
+    assert len(beliefs.history) == 4
+    assert beliefs.history == [first, call, observation, last]
+    assert beliefs.history[2] is observation
+    assert beliefs.history[-1] is last
+    assert beliefs.messages == [first, last]
+    assert beliefs.event_order == [0, 2, 1, 0]
+
+
+def test_history_rejects_other_mutations():
+    beliefs = Beliefs(initial_goal="g", history=_entries())
+
+    with pytest.raises(TypeError):
+        beliefs.history[0] = Message(role="user", content="x")
+    with pytest.raises(AttributeError):
+        beliefs.history.insert(0, Message(role="user", content="x"))
+    assert len(beliefs.history) == 4
+
+
+def test_dump_keeps_single_history_list_and_round_trips():
+    beliefs = Beliefs(initial_goal="g", facts={"x": 1})
+    beliefs.history.extend(_entries())
+
+    dumped = beliefs.model_dump()
+    assert list(dumped) == ["initial_goal", "history", "facts"]
+    assert dumped["history"][1] == {"function_name": "f", "parameters": {"a": 1}}
+
+    restored = Beliefs.model_validate(dumped)
+    assert restored.history == beliefs.history
+    assert restored.event_order == beliefs.event_order
+    assert Beliefs.model_validate_json(beliefs.model_dump_json()) == restored
+
+
+class _SearchParameters(BaseModel):
+    query: str
+    limit: int = 10
+
+
+def test_parameters_json_schema_is_a_private_copy():
+    signature = FunctionSignature(
+        name="search", description="d", parameters=_SearchParameters
+    )
+    other = FunctionSignature(
+        name="search2", description="d", parameters=_SearchParameters
+    )
+
+    schema = signature.parameters_json_schema
+    schema["properties"]["query"]["description"] = "changed"
+    schema["additionalProperties"] = False
+
+    assert other.parameters_json_schema == _SearchParameters.model_json_schema()
+    assert signature.parameters_json_schema == _SearchParameters.model_json_schema()
@@ -0,0 +1,40 @@
+import copy
+import pickle
+
+import pytest
+
+from cx_kit.schemas.common import EMPTY_DICT, FrozenDict
+from cx_kit.schemas.document import CodeBlock
+
+
+def test_frozen_dict_is_read_only():
+    frozen = FrozenDict({"a": 1})
+
+    with pytest.raises(TypeError):
+        frozen["b"] = 2
+    with pytest.raises(TypeError):
+        frozen.update(b=2)
+    assert frozen == {"a": 1}
+
+
+@pytest.mark.parametrize("frozen", [EMPTY_DICT, FrozenDict({"a": [1, {"b": 2}]})])
+def test_frozen_dict_copies_and_pickles(frozen):
+    for clone in (
+        copy.copy(frozen),
+        copy.deepcopy(frozen),
+        pickle.loads(pickle.dumps(frozen)),
+    ):
+        assert type(clone) is FrozenDict
+        assert clone == frozen
+
+    deep = copy.deepcopy(frozen)
+    if frozen:
+        assert deep["a"] is not frozen["a"]
+
+
+def test_models_with_frozen_dict_defaults_copy_and_pickle():
+    block = CodeBlock(content="x", start_line=1)
+    assert type(block.attributes) is FrozenDict
+
+    assert block.model_copy(deep=True) == block
+    assert pickle.loads(pickle.dumps(block)) == block
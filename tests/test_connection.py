@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+from cx_kit.schemas import connection
+from cx_kit.schemas.connection import Connection
+
+NOW = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+EARLIER = datetime(2024, 1, 1, tzinfo=timezone.utc)
+LATER = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+def _connection(**fields):
+    data = {
+        "id": "user:db",
+        "name": "db-main",
+        "blueprint_id": "community/sql-mssql",
+        "auth_method_type": "password",
+        "secret_ref": "user:db",
+    }
+    return Connection.model_validate({**data, **fields})
+
+
+def _freeze_clock(monkeypatch):
+    calls = []
+
+    def fake_now():
+        calls.append(None)
+        return NOW
+
+    monkeypatch.setattr(connection, "coarse_utc_now", fake_now)
+    return calls
+
+
+def test_missing_timestamps_share_one_reading(monkeypatch):
+    calls = _freeze_clock(monkeypatch)
+
+    conn = _connection()
+
+    assert conn.created_at is NOW
+    assert conn.updated_at is NOW
+    assert len(calls) == 1
+
+
+def test_null_timestamps_are_filled(monkeypatch):
+    _freeze_clock(monkeypatch)
+
+    conn = _connection(created_at=None, updated_at=None)
+
+    assert conn.created_at == conn.updated_at == NOW
+
+
+def test_only_created_at_given_defaults_updated_at_to_now(monkeypatch):
+    _freeze_clock(monkeypatch)
+
+    conn = _connection(created_at=EARLIER)
+
+    assert conn.created_at == EARLIER
+    assert conn.updated_at == NOW
+
+
+def test_only_updated_at_given_defaults_created_at_to_now(monkeypatch):
+    _freeze_clock(monkeypatch)
+
+    conn = _connection(updated_at=LATER)
+
+    assert conn.created_at == NOW
+    assert conn.updated_at == LATER
+
+
+def test_given_timestamps_skip_the_clock(monkeypatch):
+    calls = _freeze_clock(monkeypatch)
+
+    conn = _connection(created_at=EARLIER, updated_at=LATER)
+
+    assert (conn.created_at, conn.updated_at) == (EARLIER, LATER)
+    assert calls == []
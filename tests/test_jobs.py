@@ -0,0 +1,19 @@
+import pytest
+from pydantic import ValidationError
+
+from cx_kit.schemas.jobs import JobStatus, parse_job_status
+
+REPORT = b'{"status": "RUNNING", "message": "step 2 of 3"}'
+
+
+@pytest.mark.parametrize("buffer", [bytes, bytearray, memoryview])
+def test_parse_job_status_accepts_buffers(buffer):
+    status = parse_job_status(buffer(REPORT))
+
+    assert status == JobStatus(status="RUNNING", message="step 2 of 3")
+    assert parse_job_status(REPORT) is status
+
+
+def test_parse_job_status_rejects_invalid_reports():
+    with pytest.raises(ValidationError):
+        parse_job_status(bytearray(b'{"status": "DONE"}'))
@@ -0,0 +1,127 @@
+import hashlib
+import json
+
+import pytest
+
+from cx_kit.schemas.project import Block
+from cx_kit.utils.orchestration import (
+    build_dependency_graph,
+    build_step_index,
+    calculate_cache_key,
+)
+
+
+def _steps():
+    return [
+        Block(id="load"),
+        Block(id="clean", inputs=["load.rows", "load.meta"]),
+        Block(id="stats", depends_on=["load"]),
+        Block(id="report", inputs=["clean.rows", "report.self", "missing.x"]),
+        Block(id="publish", depends_on=["report", "stats"], inputs=["plain"]),
+    ]
+
+
+def test_ready_steps_follow_dependencies():
+    index = build_step_index(_steps())
+
+    assert index.ids == ["load", "clean", "stats", "report", "publish"]
+    assert index.dep_masks == [0, 0b1, 0b1, 0b10, 0b1100]
+    assert index.ready_steps(0) == [0]
+    assert index.ready_steps(0b1) == [1, 2]
+    assert index.ready_steps(0b11) == [2, 3]
+    assert index.ready_steps(0b1011) == [2]
+    assert index.ready_steps(0b1111) == [4]
+    assert index.ready_steps(0b11111) == []
+    assert index.is_ready(4, 0b1100)
+    assert not index.is_ready(4, 0b0100)
+
+
+def test_step_index_rejects_unknown_depends_on():
+    with pytest.raises(ValueError, match="invalid dependency: 'nope'"):
+        build_step_index([Block(id="a", depends_on=["nope"])])
+
+
+def test_dependency_graph_order_and_edges():
+    pytest.importorskip("networkx")
+
+    dag = build_dependency_graph(_steps())
+
+    assert list(dag.nodes) == ["load", "clean", "stats", "report", "publish"]
+    assert list(dag.edges) == [
+        ("load", "clean"),
+        ("load", "stats"),
+        ("clean", "report"),
+        ("stats", "publish"),
+        ("report", "publish"),
+    ]
+    assert dag.graph["topo_order"] == ["load", "clean", "stats", "report", "publish"]
+    assert dag.nodes["report"]["step_data"].id == "report"
+
+
+def test_dependency_graph_reports_cycles():
+    pytest.importorskip("networkx")
+
+    with pytest.raises(ValueError, match="circular dependency"):
+        build_dependency_graph(
+            [Block(id="a", depends_on=["b"]), Block(id="b", inputs=["a.x"])]
+        )
+
+
+def _previous_cache_key(rendered_block, capability_version, parent_hashes):
+    """`calculate_cache_key` as it was before it read the fields directly."""
+    hasher = hashlib.sha256()
+    semantic_fields = {
+        "engine",
+        "connection",
+        "run",
+        "content",
+        "inputs",
+        "outputs",
+        "if_condition",
+    }
+    block_dict = rendered_block.model_dump(by_alias=True)
+    semantic_dict = {
+        k: block_dict.get(k) for k in semantic_fields if block_dict.get(k) is not None
+    }
+    hasher.update(json.dumps(semantic_dict, sort_keys=True).encode("utf-8"))
+    hasher.update(capability_version.encode("utf-8"))
+    for block_id, hash_val in sorted(parent_hashes.items()):
+        hasher.update(f"{block_id}:{hash_val or ''}".encode("utf-8"))
+    return f"sha256:{hasher.hexdigest()}"
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        Block(id="empty"),
+        Block(
+            id="query",
+            engine="sql",
+            connection="user:db",
+            run={"action": "query", "params": {"limit": 10, "é": [1.5, None]}},
+            content="SELECT 1",
+            inputs=["load.rows"],
+            outputs=["rows"],
+            **{"if": "{{ flag }}"},
+        ),
+        Block(id="mapped", engine="py", outputs={"a": "b"}, content=""),
+    ],
+)
+@pytest.mark.parametrize(
+    "parents",
+    [{}, {"b": "sha256:2", "a": None}, {f"p{i}": f"h{i}" for i in range(40)}],
+)
+def test_cache_key_matches_previous_implementation(block, parents):
+    assert calculate_cache_key(block, "1.2.3", parents) == _previous_cache_key(
+        block, "1.2.3", parents
+    )
+
+
+def test_cache_key_ignores_if_condition():
+    plain = Block(id="a", engine="sql", content="x")
+    guarded = Block.model_validate(
+        {"id": "a", "engine": "sql", "content": "x", "if": "{{ no }}"}
+    )
+
+    assert calculate_cache_key(plain, "1", {}) == calculate_cache_key(guarded, "1", {})
+    assert calculate_cache_key(plain, "1", {}) != calculate_cache_key(plain, "2", {})
@@ -0,0 +1,24 @@
+from cx_kit.schemas.project import Block
+
+
+def test_block_ignores_unknown_keys():
+    block = Block.model_validate({"id": "x", "random": "y"})
+
+    assert block.id == "x"
+    assert block.model_extra is None
+    assert not hasattr(block, "random")
+    assert "random" not in block.model_dump()
+
+
+def test_block_private_attributes_still_work():
+    block = Block.model_validate({"id": "x", "if": "{{ flag }}"})
+    other = Block(id="y")
+
+    block._shell_directives["cwd"] = "/tmp"
+    block._session_update = {"var": 1}
+
+    assert block.if_condition == "{{ flag }}"
+    assert block._shell_directives == {"cwd": "/tmp"}
+    assert block._session_update == {"var": 1}
+    assert other._shell_directives == {}
+    assert "_shell_directives" not in block.model_dump()
@@ -0,0 +1,108 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from cx_kit.schemas.context import RunContext
+from cx_kit.toolkit.security import ConnectionSecrets, prefetch_secrets
+
+
+class FakeSecretService:
+    def __init__(self, secrets, failures=0):
+        self.secrets = secrets
+        self.failures = failures
+        self.calls = []
+
+    async def get_all(self, connection_id):
+        self.calls.append(connection_id)
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("backend unavailable")
+        return dict(self.secrets[connection_id])
+
+
+def _context(service):
+    # The injected services are only declared under TYPE_CHECKING, so the
+    # model cannot be validated here; its private cache is still initialized.
+    return RunContext.model_construct(
+        run_id="run", flow_id="flow", cx_home=Path("/cx"), secrets=service
+    )
+
+
+def test_secrets_are_fetched_once_per_run():
+    service = FakeSecretService({"user:db": {"password": "p"}})
+    context = _context(service)
+    derived = context.with_updates({"x": 1})
+
+    async def main():
+        first = ConnectionSecrets(context, "user:db")
+        concurrent = ConnectionSecrets(context, "user:db")
+        values = await asyncio.gather(first.get("password"), concurrent.get_all())
+        later = await ConnectionSecrets(derived, "user:db").get("password")
+        return values, later
+
+    values, later = asyncio.run(main())
+    assert values == ["p", {"password": "p"}]
+    assert later == "p"
+    assert service.calls == ["user:db"]
+
+
+def test_failed_fetch_is_evicted_and_retried():
+    service = FakeSecretService({"user:db": {"password": "p"}}, failures=1)
+    context = _context(service)
+
+    async def main():
+        with pytest.raises(ConnectionError):
+            await ConnectionSecrets(context, "user:db").get("password")
+        assert "user:db" not in context._secrets_cache
+        return await ConnectionSecrets(context, "user:db").get("password")
+
+    assert asyncio.run(main()) == "p"
+    assert service.calls == ["user:db", "user:db"]
+
+
+def test_prefetch_fills_the_cache_and_swallows_failures():
+    service = FakeSecretService(
+        {"user:a": {"k": "a"}, "user:b": {"k": "b"}}, failures=1
+    )
+    context = _context(service)
+
+    async def main():
+        await prefetch_secrets(context, ["user:a", "user:b", "user:a"])
+        cached = sorted(context._secrets_cache)
+        values = [
+            await ConnectionSecrets(context, connection_id).get("k")
+            for connection_id in ("user:a", "user:b")
+        ]
+        return cached, values
+
+    cached, values = asyncio.run(main())
+    # The first request failed and was dropped; only the other one is cached.
+    assert cached == ["user:b"]
+    assert values == ["a", "b"]
+    assert service.calls == ["user:a", "user:b", "user:a"]
+
+
+def test_context_without_cache_fetches_every_time():
+    service = FakeSecretService({"user:db": {"password": "p"}})
+    # A context object that carries no run-wide cache.
+    context = SimpleNamespace(secrets=service)
+
+    async def main():
+        await ConnectionSecrets(context, "user:db").get("password")
+        await ConnectionSecrets(context, "user:db").get("password")
+
+    asyncio.run(main())
+    assert service.calls == ["user:db", "user:db"]
+
+
+def test_with_updates_shares_paths_and_cache():
+    context = _context(FakeSecretService({}))
+    derived = context.with_updates({"x": 1})
+
+    assert derived.cx_home is context.cx_home
+    assert derived._secrets_cache is context._secrets_cache
+    assert derived.variables == {"x": 1}
+    assert context.variables == {}
@@ -0,0 +1,132 @@
+import enum
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from cx_kit.utils.serialization import safe_serialize
+
+
+def test_datetimes_serialize_with_utc_suffix():
+    assert safe_serialize(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02T03:04:05Z"
+    assert (
+        safe_serialize(datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc))
+        == "2024-01-02T03:04:05.000006Z"
+    )
+
+
+def test_pandas_nat_is_not_given_a_utc_suffix():
+    pd = pytest.importorskip("pandas")
+
+    assert safe_serialize(pd.NaT) == "NaT"
+    frame = pd.DataFrame({"at": [pd.Timestamp("2024-01-02"), pd.NaT]})
+    assert safe_serialize(frame) == [{"at": "2024-01-02T00:00:00Z"}, {"at": "NaT"}]
+    assert safe_serialize(frame["at"]) == ["2024-01-02T00:00:00Z", "NaT"]
+
+
+def test_pandas_timestamps_serialize_like_datetimes():
+    pd = pytest.importorskip("pandas")
+
+    naive = pd.Timestamp("2024-01-02T03:04:05.123456")
+    assert safe_serialize(naive) == "2024-01-02T03:04:05.123456Z"
+    assert safe_serialize(naive.tz_localize("UTC")) == "2024-01-02T03:04:05.123456Z"
+    assert (
+        safe_serialize(pd.Timestamp("2024-01-02T03:04:05", tz="America/New_York"))
+        == "2024-01-02T03:04:05-05:00"
+    )
+    # Nanoseconds are dropped, as `to_pydatetime()` did.
+    assert (
+        safe_serialize(pd.Timestamp("2024-01-02T03:04:05.123456789"))
+        == "2024-01-02T03:04:05.123456Z"
+    )
+
+
+def test_pandas_containers_serialize_to_json_types():
+    pd = pytest.importorskip("pandas")
+
+    frame = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "t": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+            "s": ["x", "y"],
+        }
+    )
+    assert safe_serialize(frame) == [
+        {"a": 1, "t": "2024-01-02T00:00:00Z", "s": "x"},
+        {"a": 2, "t": "2024-01-03T00:00:00Z", "s": "y"},
+    ]
+    assert safe_serialize(pd.Series([1, 2])) == [1, 2]
+    assert [type(value) for value in safe_serialize(pd.Series([1, 2]))] == [int, int]
+
+
+def test_datetime64_values_serialize_as_iso_strings():
+    np = pytest.importorskip("numpy")
+
+    for unit in ("ns", "us"):
+        values = np.array(
+            ["2024-01-02T03:04:05.123456789"], dtype=f"datetime64[{unit}]"
+        )
+        assert safe_serialize(values) == ["2024-01-02T03:04:05.123456Z"]
+    seconds = np.array(["2024-01-02T03:04:05", "NaT"], dtype="datetime64[s]")
+    assert safe_serialize(seconds) == ["2024-01-02T03:04:05Z", None]
+    assert (
+        safe_serialize(np.datetime64("2024-01-02T03:04:05.5", "ns"))
+        == "2024-01-02T03:04:05.500000Z"
+    )
+    assert safe_serialize(np.datetime64("NaT", "s")) is None
+    assert safe_serialize(np.array([1.5, 2.5])) == [1.5, 2.5]
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Point(BaseModel):
+    x: int
+    at: datetime
+
+
+class Label(str):
+    pass
+
+
+def test_mixed_payload():
+    payload = {
+        "s": "x",
+        "i": 1,
+        "f": 1.5,
+        "b": True,
+        "n": None,
+        1: [date(2024, 1, 2), UUID(int=1), Decimal("2.5")],
+        "bytes": [b"text", b"\xff\xfe"],
+        "tuple": (1, datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=2)))),
+        "model": Point(x=1, at=datetime(2024, 1, 2)),
+        "label": Label("l"),
+        "enum": Color.RED,
+    }
+
+    assert safe_serialize(payload) == {
+        "s": "x",
+        "i": 1,
+        "f": 1.5,
+        "b": True,
+        "n": None,
+        "1": ["2024-01-02", "00000000-0000-0000-0000-000000000001", 2.5],
+        "bytes": ["text", "<binary data of size 2 bytes>"],
+        "tuple": (1, datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=2)))),
+        "model": {"x": 1, "at": "2024-01-02T00:00:00Z"},
+        "label": "l",
+        "enum": Color.RED,
+    }
+
+
+def test_numpy_scalars_become_python_scalars():
+    np = pytest.importorskip("numpy")
+
+    values = safe_serialize([np.int64(3), np.float64(2.5), np.bool_(True)])
+    assert values == [3, 2.5, True]
+    assert [type(value) for value in values] == [int, float, bool]
+    assert safe_serialize(np.array([[1, 2], [3, 4]])) == [[1, 2], [3, 4]]
+    assert safe_serialize(np.array([{"a": np.int8(1)}], dtype=object)) == [{"a": 1}]
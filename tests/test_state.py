@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from cx_kit.contracts.config import BaseConfig
+from cx_kit.contracts.state import BaseStateProvider, InMemoryStateProvider
+from cx_kit.schemas.results import StepResult
+
+
+class LegacyStateProvider(BaseStateProvider):
+    """A provider written against the contract before `get_step_results`."""
+
+    provider_key = "test:legacy"
+    ConfigModel = BaseConfig
+
+    async def create(self, initial_context):
+        return initial_context.run_id
+
+    async def get(self, run_id):
+        raise KeyError(run_id)
+
+    async def save(self, context):
+        pass
+
+    async def add_step_result(self, run_id, step_id, result):
+        pass
+
+    async def delete(self, run_id):
+        pass
+
+
+def test_provider_without_get_step_results_can_be_instantiated():
+    provider = LegacyStateProvider(BaseConfig())
+
+    with pytest.raises(NotImplementedError, match="LegacyStateProvider"):
+        asyncio.run(provider.get_step_results("run-1"))
+
+
+def test_in_memory_provider_records_step_results():
+    async def scenario():
+        provider = InMemoryStateProvider(BaseConfig())
+        run_id = await provider.create(SimpleNamespace(run_id="run-1"))
+        first = StepResult(data=1)
+        await provider.add_step_result(run_id, "a", first)
+        await provider.add_step_result(run_id, "b", StepResult(data=2))
+        await provider.add_step_result(run_id, "b", StepResult(data=3))
+        results = await provider.get_step_results(run_id)
+        await provider.delete(run_id)
+        return results, first, provider
+
+    results, first, provider = asyncio.run(scenario())
+    assert list(results) == ["a", "b"]
+    assert results["a"] is first
+    assert results["b"].data == 3
+    with pytest.raises(KeyError):
+        asyncio.run(provider.get_step_results("run-1"))
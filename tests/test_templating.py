@@ -0,0 +1,101 @@
+import gc
+import weakref
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from cx_kit.utils.serialization import safe_serialize
+from cx_kit.utils.templating import (
+    compile_expression,
+    create_jinja_environment,
+    precompile,
+    recursive_render,
+    render_and_serialize,
+)
+
+
+def test_compiled_expressions_are_cached_per_environment():
+    env = create_jinja_environment()
+    other = create_jinja_environment()
+
+    compiled = compile_expression("a + 1", env)
+    assert compile_expression("a + 1", env) is compiled
+    assert compile_expression("a + 1", other) is not compiled
+    assert compiled(a=1) == 2
+
+
+def test_environment_is_released_with_its_cache():
+    env = create_jinja_environment()
+    assert recursive_render({"x": "{{ a }}", "y": "n={{ a }}"}, {"a": 1}, env) == {
+        "x": 1,
+        "y": "n=1",
+    }
+    ref = weakref.ref(env)
+
+    del env
+    gc.collect()
+    assert ref() is None
+
+
+def test_overlay_gets_its_own_cache():
+    env = create_jinja_environment()
+    compile_expression("a", env)
+    overlay = env.overlay()
+    overlay.filters["double"] = lambda value: value * 2
+
+    assert compile_expression("a | double", overlay)(a=2) == 4
+    assert compile_expression("a", overlay) is not compile_expression("a", env)
+
+
+SPEC = {
+    "literal": "plain text",
+    "when": "{{ at }}",
+    "items": ["{{ ids }}", "id={{ ids[0] }}", 7, None, {"nested": "{{ amount }}"}],
+    3: "{{ missing }}",
+    "greeting": "  {{ name | upper }}  ",
+    "mixed": "{{ a }} and {{ b }}",
+    "raw": datetime(2024, 1, 2),
+}
+CONTEXT = {
+    "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "ids": (1, 2),
+    "amount": Decimal("1.5"),
+    "name": "ada",
+    "a": 1,
+    "b": 2,
+}
+
+
+def test_render_and_serialize_matches_two_passes():
+    env = create_jinja_environment()
+
+    assert render_and_serialize(SPEC, CONTEXT, env) == safe_serialize(
+        recursive_render(SPEC, CONTEXT, env)
+    )
+    assert render_and_serialize(SPEC, CONTEXT) == safe_serialize(
+        recursive_render(SPEC, CONTEXT)
+    )
+    assert render_and_serialize(SPEC, CONTEXT)["when"] == "2024-01-02T03:04:05Z"
+
+
+def test_literal_strings_are_returned_unchanged():
+    env = create_jinja_environment()
+    literal = "  spaced {not a template}  "
+
+    assert recursive_render(literal, {}, env) is literal
+    assert recursive_render("  {{ a }}  ", {"a": [1]}, env) == [1]
+    assert recursive_render("x {{ a }} y", {"a": 1}, env) == "x 1 y"
+
+
+def test_malformed_templates_raise_value_error():
+    env = create_jinja_environment()
+    precompile({"bad": "{{ a }", "ok": ["{{ b }}"]}, env)
+
+    with pytest.raises(ValueError, match="Jinja rendering failed"):
+        recursive_render("x {{ a }", {"a": 1}, env)
+    with pytest.raises(ValueError, match="Jinja rendering failed"):
+        render_and_serialize({"k": ["{{ a }} {{"]}, {"a": 1}, env)
+    # Only strings containing "{{" are treated as templates.
+    assert render_and_serialize({"k": ["{% if %}"]}, {}, env) == {"k": ["{% if %}"]}
+    assert compile_expression("b", env)(b=2) == 2
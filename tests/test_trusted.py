@@ -0,0 +1,101 @@
+from typing import Any, Dict, List, Literal, Optional
+
+import pytest
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from cx_kit.schemas import common
+from cx_kit.schemas.common import TrustedModel
+from cx_kit.schemas.connection import ConnectionSpec
+from cx_kit.schemas.document import ParsedDocument
+from cx_kit.schemas.server_schemas import SepMessage, SepPayload
+
+
+class Sample(TrustedModel):
+    name: str
+    level: Literal["info", "warn"] = "info"
+    tags: List[str] = Field(default_factory=list)
+    limits: Dict[str, int] = {"max": 1}
+    note: Optional[str] = None
+
+    _seen: List[str] = PrivateAttr(default_factory=list)
+    _post_init_calls: int = PrivateAttr(0)
+
+    def model_post_init(self, context: Any) -> None:
+        self._post_init_calls += 1
+
+
+class Open(TrustedModel):
+    name: str
+
+    model_config = ConfigDict(extra="allow")
+
+
+def _state(instance):
+    return (
+        instance.__dict__,
+        instance.model_fields_set,
+        instance.__pydantic_extra__,
+        instance.__pydantic_private__,
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{"name": "a"}, {"name": "a", "level": "warn", "tags": ["x"], "note": "n"}],
+)
+def test_from_trusted_matches_model_construct(data):
+    trusted = Sample.from_trusted(**data)
+    constructed = Sample.model_construct(**data)
+
+    assert _state(trusted) == _state(constructed)
+    assert trusted._post_init_calls == 1
+    # Default factories and mutable defaults are fresh per instance.
+    assert trusted.limits is not Sample.from_trusted(**data).limits
+    assert trusted._seen is not Sample.from_trusted(**data)._seen
+
+
+def test_from_trusted_keeps_extra_fields():
+    trusted = Open.from_trusted(name="a", other=1)
+
+    assert _state(trusted) == _state(Open.model_construct(name="a", other=1))
+
+
+def test_from_trusted_private_attributes_on_sep_message():
+    fields = dict(
+        trace_id="t",
+        event_id="e",
+        type="x",
+        source="/s",
+        timestamp="2024-01-02T03:04:05Z",
+        payload=SepPayload(level="info", message="m"),
+    )
+    trusted = SepMessage.from_trusted(**fields)
+
+    assert trusted._cached_json is None
+    assert _state(trusted) == _state(SepMessage.model_construct(**fields))
+
+
+def test_from_trusted_validates_when_disabled(monkeypatch):
+    monkeypatch.setattr(common, "TRUSTED_CONSTRUCT", False)
+
+    assert Sample.from_trusted(name="a") == Sample(name="a")
+
+
+def test_specialized_from_trusted_take_keyword_fields():
+    spec = ConnectionSpec.from_trusted(
+        blueprint_id="b", capability_id="c", alias="db", details={"x": 1}
+    )
+    assert spec == ConnectionSpec(
+        blueprint_id="b", capability_id="c", alias="db", details={"x": 1}
+    )
+    with pytest.raises(TypeError):
+        ConnectionSpec.from_trusted("b", "c", "db")
+
+    document = ParsedDocument(
+        frontmatter={"title": "t"},
+        blocks=[
+            {"type": "markdown", "content": "# t"},
+            {"type": "code", "id": "a", "content": "x", "start_line": 3},
+        ],
+    )
+    assert ParsedDocument.from_trusted(**document.model_dump()) == document
@@ -0,0 +1,181 @@
+import json
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from cx_kit.schemas import wire
+from cx_kit.schemas.communication import (
+    BlockOutput,
+    ClientCommand,
+    ServerEvent,
+    ServerEventPayload,
+)
+from cx_kit.schemas.server_schemas import SepMessage, SepPayload
+
+
+def _event(**payload):
+    return SepMessage(
+        command_id="trace-1",
+        id="event-1",
+        type="block.output",
+        source="/cx-server",
+        timestamp="2024-01-02T03:04:05Z",
+        payload=SepPayload(level="info", message="hi", **payload),
+    )
+
+
+def test_encode_event_after_field_reassignment():
+    message = _event()
+    first = wire.encode_event(message)
+    assert wire.encode_event(message) is first
+
+    message.payload = SepPayload(level="warn", message="changed")
+    second = json.loads(wire.encode_event(message))
+    assert second["payload"]["message"] == "changed"
+
+    copied = message.model_copy(update={"type": "block.status"})
+    assert json.loads(wire.encode_event(copied))["type"] == "block.status"
+    assert json.loads(wire.encode_event(message))["type"] == "block.output"
+
+
+@pytest.fixture(params=["msgspec", "pydantic"])
+def wire_path(request, monkeypatch):
+    if request.param == "msgspec":
+        if not wire._MSGSPEC_AVAILABLE:
+            pytest.skip("msgspec is not installed")
+    else:
+        monkeypatch.setattr(wire, "_MSGSPEC_AVAILABLE", False)
+    return request.param
+
+
+COMMAND = {"command_id": "trace-1", "type": "page.load", "payload": {"uri": "a"}}
+
+
+@pytest.mark.parametrize("id_key", ["command_id", "trace_id"])
+def test_decode_command_accepts_alias_and_field_name(wire_path, id_key):
+    data = dict(COMMAND)
+    data[id_key] = data.pop("command_id")
+    raw = json.dumps(data).encode()
+
+    command = wire.decode_command(raw)
+    assert (command.trace_id, command.type, command.payload) == (
+        "trace-1",
+        "page.load",
+        {"uri": "a"},
+    )
+    envelope = wire.decode_command_envelope(raw)
+    assert (envelope.trace_id, envelope.type) == ("trace-1", "page.load")
+    assert envelope.load_payload() == {"uri": "a"}
+
+
+@pytest.mark.parametrize("id_keys", [("command_id", "id"), ("trace_id", "event_id")])
+def test_decode_event_round_trips(wire_path, id_keys):
+    message = _event(fields={"n": 1}, labels={"k": "v"})
+    data = json.loads(message.__pydantic_serializer__.to_json(message, by_alias=True))
+    data[id_keys[0]] = data.pop("command_id")
+    data[id_keys[1]] = data.pop("id")
+
+    decoded = wire.decode_event(json.dumps(data).encode())
+    assert decoded.model_dump() == message.model_dump()
+    assert json.loads(wire.encode_event(decoded)) == json.loads(
+        wire.encode_event(message)
+    )
+
+
+@pytest.mark.parametrize(
+    "decode", [wire.decode_command, wire.decode_command_envelope, wire.decode_event]
+)
+@pytest.mark.parametrize("raw", [b"{not json", b'{"type": "x"}', b"[]"])
+def test_malformed_messages_raise_pydantic_validation_error(wire_path, decode, raw):
+    with pytest.raises(ValidationError):
+        decode(raw)
+
+
+CLIENT_COMMAND = {
+    "trace_id": "6f1c2b1e-8d4a-4c5e-9f3b-2a7d9e0c1b2a",
+    "type": "block.run",
+    "payload": {"page_id": "p"},
+}
+
+
+def test_decode_client_command_always_returns_the_model(wire_path):
+    command = wire.decode_client_command(json.dumps(CLIENT_COMMAND).encode())
+
+    assert isinstance(command, ClientCommand)
+    assert command.model_dump(mode="json") == CLIENT_COMMAND
+    with pytest.raises(ValidationError):
+        wire.decode_client_command(b"{not json")
+    with pytest.raises(ValidationError):
+        wire.decode_client_command_envelope(b"{not json")
+
+
+def test_decode_client_command_struct(wire_path):
+    raw = json.dumps(CLIENT_COMMAND).encode()
+    if wire_path == "pydantic":
+        with pytest.raises(RuntimeError):
+            wire.decode_client_command_struct(raw)
+        return
+
+    struct = wire.decode_client_command_struct(raw)
+    command = wire.decode_client_command(raw)
+    assert (struct.trace_id, struct.type, struct.payload) == (
+        command.trace_id,
+        command.type,
+        command.payload,
+    )
+
+
+def _server_event():
+    return ServerEvent(
+        trace_id=uuid.UUID(int=1),
+        id=uuid.UUID(int=2),
+        type="block.output",
+        timestamp="2024-01-02T03:04:05.123Z",
+        payload=ServerEventPayload(
+            level="info",
+            message="done",
+            fields={"out": BlockOutput(inline_data={"x": [1, 2]}), "n": 1.5},
+        ),
+    )
+
+
+def test_encode_event_bytes_match_pydantic(wire_path):
+    message = _event(
+        fields={"out": BlockOutput(inline_data={"a": [1, None]}), "n": 1.5},
+        labels={"k": "v"},
+    )
+
+    assert wire.encode_event(message) == message.__pydantic_serializer__.to_json(
+        message, by_alias=True
+    )
+
+
+def test_encode_server_event_bytes_match_pydantic(wire_path):
+    event = _server_event()
+
+    assert wire.encode_server_event(event) == event.__pydantic_serializer__.to_json(
+        event
+    )
+
+
+def test_struct_events_encode_like_their_models():
+    if not wire._MSGSPEC_AVAILABLE:
+        pytest.skip("msgspec is not installed")
+    message = _event(fields={"n": 1}, labels={"k": "v"})
+    payload = message.payload
+    struct = wire.SepMessageStruct(
+        trace_id=message.trace_id,
+        event_id=message.event_id,
+        type=message.type,
+        source=message.source,
+        timestamp=message.timestamp,
+        payload=wire.SepPayloadStruct(
+            level=payload.level,
+            message=payload.message,
+            fields=wire.msgspec.Raw(b'{"n":1}'),
+            labels=payload.labels,
+        ),
+    )
+
+    assert wire.encode_event(struct) == wire.encode_event(message)
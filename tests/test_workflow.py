@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from cx_kit.contracts.workflow import BaseBlockInterceptor, compose_block_interceptors
+
+
+class Wrapper(BaseBlockInterceptor):
+    def __init__(self, name, priority, calls, short_circuit=False):
+        self.name = name
+        self.priority = priority
+        self.calls = calls
+        self.short_circuit = short_circuit
+
+    async def intercept(self, context, block, next_handler):
+        self.calls.append(f"{self.name}:before")
+        if self.short_circuit:
+            return f"cached:{block}"
+        result = await next_handler(context)
+        self.calls.append(f"{self.name}:after")
+        return result
+
+
+class Observer(BaseBlockInterceptor):
+    def __init__(self, name, priority, calls):
+        self.name = name
+        self.priority = priority
+        self.calls = calls
+
+    def sync_intercept(self, context, block):
+        self.calls.append(f"{self.name}:{context}:{block}")
+
+
+def _handler(calls):
+    async def handler(context, block):
+        calls.append(f"handler:{context}:{block}")
+        return f"ran:{block}"
+
+    return handler
+
+
+def test_interceptors_run_in_priority_order():
+    calls = []
+    interceptors = [
+        Wrapper("inner", 30, calls),
+        Observer("late", 40, calls),
+        Observer("first", 5, calls),
+        Wrapper("outer", 10, calls),
+        Observer("middle-a", 20, calls),
+        Observer("middle-b", 25, calls),
+    ]
+    run = compose_block_interceptors(interceptors, _handler(calls))
+
+    assert asyncio.run(run("ctx", "b1")) == "ran:b1"
+    assert calls == [
+        "first:ctx:b1",
+        "outer:before",
+        "middle-a:ctx:b1",
+        "middle-b:ctx:b1",
+        "inner:before",
+        "late:ctx:b1",
+        "handler:ctx:b1",
+        "inner:after",
+        "outer:after",
+    ]
+
+
+def test_short_circuit_skips_inner_interceptors_and_handler():
+    calls = []
+    interceptors = [
+        Observer("outside", 1, calls),
+        Wrapper("cache", 10, calls, short_circuit=True),
+        Observer("inside", 20, calls),
+        Wrapper("inner", 30, calls),
+    ]
+    run = compose_block_interceptors(interceptors, _handler(calls))
+
+    assert asyncio.run(run("ctx", "b1")) == "cached:b1"
+    assert calls == ["outside:ctx:b1", "cache:before"]
+
+
+def test_composed_chain_is_reusable_per_block():
+    calls = []
+    run = compose_block_interceptors(
+        [Observer("log", 1, calls), Wrapper("wrap", 2, calls)], _handler(calls)
+    )
+
+    assert asyncio.run(run("c", "b1")) == "ran:b1"
+    assert asyncio.run(run("c", "b2")) == "ran:b2"
+    assert [call for call in calls if call.startswith("handler")] == [
+        "handler:c:b1",
+        "handler:c:b2",
+    ]
+    bare = compose_block_interceptors([], _handler(calls))
+    assert asyncio.run(bare("c", "b3")) == "ran:b3"
+
+
+def test_interceptor_without_a_hook_cannot_be_instantiated():
+    class Empty(BaseBlockInterceptor):
+        pass
+
+    with pytest.raises(TypeError):
+        Empty()